@@ -4,168 +4,210 @@ Gaming-inspired design constants and settings
 """
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+import threading
+from functools import cached_property
+from types import MappingProxyType
+from typing import Final, FrozenSet, Mapping, NamedTuple, Optional, Tuple
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from .env outside production (containers get them
+# from the orchestrator); exported variables always win over the file
+if os.environ.get('BOT_ENV') != 'production':
+    load_dotenv(override=False)
 
 
-@dataclass
 class BotColors:
     """Gaming-inspired neon color scheme"""
+    __slots__ = ()
+
     # Primary colors
-    NEON_BLUE = 0x00D4FF
-    NEON_PURPLE = 0x9D00FF
-    NEON_PINK = 0xFF00DC
-    NEON_GREEN = 0x00FF88
-    NEON_YELLOW = 0xFFD700
-    NEON_ORANGE = 0xFF6B00
-    NEON_RED = 0xFF0040
+    NEON_BLUE: Final[int] = 0x00D4FF
+    NEON_PURPLE: Final[int] = 0x9D00FF
+    NEON_PINK: Final[int] = 0xFF00DC
+    NEON_GREEN: Final[int] = 0x00FF88
+    NEON_YELLOW: Final[int] = 0xFFD700
+    NEON_ORANGE: Final[int] = 0xFF6B00
+    NEON_RED: Final[int] = 0xFF0040
 
     # Status colors
-    SUCCESS = 0x00FF88
-    ERROR_RED = 0xFF0040
-    WARNING_YELLOW = 0xFFD700
-    INFO_BLUE = 0x00D4FF
+    SUCCESS: Final[int] = 0x00FF88
+    ERROR_RED: Final[int] = 0xFF0040
+    WARNING_YELLOW: Final[int] = 0xFFD700
+    INFO_BLUE: Final[int] = 0x00D4FF
 
     # Music states
-    PLAYING = 0x00FF88
-    PAUSED = 0xFFD700
-    STOPPED = 0xFF0040
-    LOADING = 0x00D4FF
+    PLAYING: Final[int] = 0x00FF88
+    PAUSED: Final[int] = 0xFFD700
+    STOPPED: Final[int] = 0xFF0040
+    LOADING: Final[int] = 0x00D4FF
 
     # Effect colors
-    BASS_BOOST = 0x9D00FF
-    NIGHTCORE = 0xFF00DC
-    KARAOKE = 0x00D4FF
-    ECHO = 0xFF6B00
-    THREE_D = 0x00FF88
+    BASS_BOOST: Final[int] = 0x9D00FF
+    NIGHTCORE: Final[int] = 0xFF00DC
+    KARAOKE: Final[int] = 0x00D4FF
+    ECHO: Final[int] = 0xFF6B00
+    THREE_D: Final[int] = 0x00FF88
 
 
-@dataclass
 class BotEmojis:
     """Gaming and music emojis"""
+    __slots__ = ()
+
     # Music controls
-    PLAY = "▶️"
-    PAUSE = "⏸️"
-    STOP = "⏹️"
-    SKIP = "⏭️"
-    PREVIOUS = "⏮️"
-    LOOP = "🔁"
-    SHUFFLE = "🔀"
-    QUEUE = "📋"
+    PLAY: Final[str] = "▶️"
+    PAUSE: Final[str] = "⏸️"
+    STOP: Final[str] = "⏹️"
+    SKIP: Final[str] = "⏭️"
+    PREVIOUS: Final[str] = "⏮️"
+    LOOP: Final[str] = "🔁"
+    SHUFFLE: Final[str] = "🔀"
+    QUEUE: Final[str] = "📋"
 
     # Volume
-    VOLUME_HIGH = "🔊"
-    VOLUME_MEDIUM = "🔉"
-    VOLUME_LOW = "🔈"
-    VOLUME_MUTE = "🔇"
+    VOLUME_HIGH: Final[str] = "🔊"
+    VOLUME_MEDIUM: Final[str] = "🔉"
+    VOLUME_LOW: Final[str] = "🔈"
+    VOLUME_MUTE: Final[str] = "🔇"
 
     # Status
-    LOADING = "⏳"
-    SUCCESS = "✅"
-    ERROR = "❌"
-    WARNING = "⚠️"
-    INFO = "ℹ️"
-    GAMING = "🎮"
-    MUSIC = "🎵"
-    STAR = "⭐"
-    FIRE = "🔥"
-    LIGHTNING = "⚡"
-    ROCKET = "🚀"
-    CROWN = "👑"
+    LOADING: Final[str] = "⏳"
+    SUCCESS: Final[str] = "✅"
+    ERROR: Final[str] = "❌"
+    WARNING: Final[str] = "⚠️"
+    INFO: Final[str] = "ℹ️"
+    GAMING: Final[str] = "🎮"
+    MUSIC: Final[str] = "🎵"
+    STAR: Final[str] = "⭐"
+    FIRE: Final[str] = "🔥"
+    LIGHTNING: Final[str] = "⚡"
+    ROCKET: Final[str] = "🚀"
+    CROWN: Final[str] = "👑"
 
     # Platforms
-    YOUTUBE = "🎬"
-    SPOTIFY = "🎧"
-    SOUNDCLOUD = "☁️"
+    YOUTUBE: Final[str] = "🎬"
+    SPOTIFY: Final[str] = "🎧"
+    SOUNDCLOUD: Final[str] = "☁️"
 
     # Effects
-    BASS_BOOST = "🔊"
-    NIGHTCORE = "🌙"
-    KARAOKE = "🎤"
-    ECHO = "🔄"
-    THREE_D = "🎭"
+    BASS_BOOST: Final[str] = "🔊"
+    NIGHTCORE: Final[str] = "🌙"
+    KARAOKE: Final[str] = "🎤"
+    ECHO: Final[str] = "🔄"
+    THREE_D: Final[str] = "🎭"
 
     # Progress bar
-    PROGRESS_START_FULL = "🟦"
-    PROGRESS_MID_FULL = "🟦"
-    PROGRESS_END_FULL = "🟦"
-    PROGRESS_START_EMPTY = "⬜"
-    PROGRESS_MID_EMPTY = "⬜"
-    PROGRESS_END_EMPTY = "⬜"
-    PROGRESS_SLIDER = "🔘"
+    PROGRESS_START_FULL: Final[str] = "🟦"
+    PROGRESS_MID_FULL: Final[str] = "🟦"
+    PROGRESS_END_FULL: Final[str] = "🟦"
+    PROGRESS_START_EMPTY: Final[str] = "⬜"
+    PROGRESS_MID_EMPTY: Final[str] = "⬜"
+    PROGRESS_END_EMPTY: Final[str] = "⬜"
+    PROGRESS_SLIDER: Final[str] = "🔘"
+
+
+def _as_bool(value: str) -> bool:
+    """Parse a true/false environment value"""
+    return value.lower() == 'true'
+
+
+def _as_id_set(value: str) -> FrozenSet[int]:
+    """Parse a comma-separated list of Discord IDs"""
+    return frozenset(int(part) for part in value.split(',') if part.strip())
 
 
 class Config:
     """Bot configuration from environment variables"""
 
-    def __init__(self):
+    # (attribute/env var, cast, typed default) - cast only runs for variables that are set
+    _FIELDS = (
         # Discord
-        self.DISCORD_TOKEN = os.getenv('DISCORD_TOKEN', '')
-        self.DEFAULT_PREFIX = os.getenv('DEFAULT_PREFIX', '!')
-        self.OWNER_ID = int(os.getenv('OWNER_ID', '0'))
+        ('DISCORD_TOKEN', str, ''),
+        ('DEFAULT_PREFIX', str, '!'),
+        ('OWNER_ID', int, 0),
 
         # Bot info
-        self.BOT_NAME = os.getenv('BOT_NAME', 'KazeBeats')
-        self.BOT_VERSION = os.getenv('BOT_VERSION', '1.0.0')
-        self.BOT_DESCRIPTION = os.getenv('BOT_DESCRIPTION',
-                                         'High-performance Discord music bot with gaming-inspired design')
+        ('BOT_NAME', str, 'KazeBeats'),
+        ('BOT_VERSION', str, '1.0.0'),
+        ('BOT_DESCRIPTION', str, 'High-performance Discord music bot with gaming-inspired design'),
+        ('BOT_ENV', str, 'development'),
+        ('DEBUG', _as_bool, False),
 
         # Audio settings
-        self.AUDIO_BITRATE = int(os.getenv('AUDIO_BITRATE', '320'))
-        self.AUDIO_SAMPLE_RATE = int(os.getenv('AUDIO_SAMPLE_RATE', '48000'))
-        self.MAX_VOLUME = int(os.getenv('MAX_VOLUME', '200'))
-        self.DEFAULT_VOLUME = int(os.getenv('DEFAULT_VOLUME', '100'))
+        ('AUDIO_BITRATE', int, 320),
+        ('AUDIO_SAMPLE_RATE', int, 48000),
+        ('MAX_VOLUME', int, 200),
+        ('DEFAULT_VOLUME', int, 100),
 
         # Database
-        self.DB_TYPE = os.getenv('DB_TYPE', 'sqlite')
-        self.DB_PATH = os.getenv('DB_PATH', 'kazebeats.db')
-        self.DB_HOST = os.getenv('DB_HOST', 'localhost')
-        self.DB_PORT = int(os.getenv('DB_PORT', '5432'))
-        self.DB_NAME = os.getenv('DB_NAME', 'kazebeats')
-        self.DB_USER = os.getenv('DB_USER', 'kazebeats_user')
-        self.DB_PASSWORD = os.getenv('DB_PASSWORD', '')
+        ('DB_TYPE', str, 'sqlite'),
+        ('DB_PATH', str, 'kazebeats.db'),
+        ('DB_HOST', str, 'localhost'),
+        ('DB_PORT', int, 5432),
+        ('DB_NAME', str, 'kazebeats'),
+        ('DB_USER', str, 'kazebeats_user'),
+        ('DB_PASSWORD', str, ''),
+        ('DB_POOL_SIZE', int, 5),
+        ('DB_MAX_OVERFLOW', int, 20),
+        ('DB_POOL_TIMEOUT', int, 10),
 
         # Redis cache
-        self.REDIS_ENABLED = os.getenv('REDIS_ENABLED', 'false').lower() == 'true'
-        self.REDIS_HOST = os.getenv('REDIS_HOST', 'redis')
-        self.REDIS_PORT = int(os.getenv('REDIS_PORT', '6379'))
-        self.REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', '')
+        ('REDIS_ENABLED', _as_bool, False),
+        ('REDIS_HOST', str, 'redis'),
+        ('REDIS_PORT', int, 6379),
+        ('REDIS_PASSWORD', str, ''),
 
         # API Keys
-        self.YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY', '')
-        self.SPOTIFY_CLIENT_ID = os.getenv('SPOTIFY_CLIENT_ID', '')
-        self.SPOTIFY_CLIENT_SECRET = os.getenv('SPOTIFY_CLIENT_SECRET', '')
-        self.SOUNDCLOUD_CLIENT_ID = os.getenv('SOUNDCLOUD_CLIENT_ID', '')
-        self.GENIUS_API_TOKEN = os.getenv('GENIUS_API_TOKEN', '')
+        ('YOUTUBE_API_KEY', str, ''),
+        ('SPOTIFY_CLIENT_ID', str, ''),
+        ('SPOTIFY_CLIENT_SECRET', str, ''),
+        ('SOUNDCLOUD_CLIENT_ID', str, ''),
+        ('GENIUS_API_TOKEN', str, ''),
 
         # Web Dashboard
-        self.WEB_ENABLED = os.getenv('WEB_ENABLED', 'true').lower() == 'true'
-        self.WEB_PORT = int(os.getenv('WEB_PORT', '8080'))
-        self.WEB_SECRET_KEY = os.getenv('WEB_SECRET_KEY', 'your_secret_key_here')
-        self.WEB_HOST = os.getenv('WEB_HOST', '0.0.0.0')
+        ('WEB_ENABLED', _as_bool, True),
+        ('WEB_PORT', int, 8080),
+        ('WEB_SECRET_KEY', str, 'your_secret_key_here'),
+        ('WEB_HOST', str, '0.0.0.0'),
 
         # Performance
-        self.MAX_QUEUE_SIZE = int(os.getenv('MAX_QUEUE_SIZE', '1000'))
-        self.CACHE_SIZE_MB = int(os.getenv('CACHE_SIZE_MB', '500'))
-        self.PRELOAD_NEXT_TRACK = os.getenv('PRELOAD_NEXT_TRACK', 'true').lower() == 'true'
-        self.AUTO_DISCONNECT_TIMEOUT = int(os.getenv('AUTO_DISCONNECT_TIMEOUT', '300'))
+        ('MAX_QUEUE_SIZE', int, 1000),
+        ('CACHE_SIZE_MB', int, 500),
+        ('PRELOAD_NEXT_TRACK', _as_bool, True),
+        ('AUTO_DISCONNECT_TIMEOUT', int, 300),
 
         # Features
-        self.ENABLE_EFFECTS = os.getenv('ENABLE_EFFECTS', 'true').lower() == 'true'
-        self.ENABLE_LYRICS = os.getenv('ENABLE_LYRICS', 'true').lower() == 'true'
-        self.ENABLE_PLAYLISTS = os.getenv('ENABLE_PLAYLISTS', 'true').lower() == 'true'
-        self.ENABLE_ANALYTICS = os.getenv('ENABLE_ANALYTICS', 'true').lower() == 'true'
-        self.ENABLE_AUTO_DJ = os.getenv('ENABLE_AUTO_DJ', 'true').lower() == 'true'
+        ('ENABLE_EFFECTS', _as_bool, True),
+        ('ENABLE_LYRICS', _as_bool, True),
+        ('ENABLE_PLAYLISTS', _as_bool, True),
+        ('ENABLE_ANALYTICS', _as_bool, True),
+        ('ENABLE_AUTO_DJ', _as_bool, True),
+        ('ALWAYS_ENABLED_GUILDS', _as_id_set, frozenset()),
 
         # Logging
-        self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-        self.LOG_FILE = os.getenv('LOG_FILE', 'logs/kazebeats.log')
-        self.LOG_MAX_SIZE_MB = int(os.getenv('LOG_MAX_SIZE_MB', '10'))
-        self.LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', '5'))
+        ('LOG_LEVEL', str, 'INFO'),
+        ('LOG_FILE', str, 'logs/kazebeats.log'),
+        ('LOG_MAX_SIZE_MB', int, 10),
+        ('LOG_BACKUP_COUNT', int, 5),
+    )
+
+    _instance: Optional['Config'] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> 'Config':
+        """Get the shared configuration, parsed once per process"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        # Environment settings
+        env = os.environ
+        for name, cast, default in self._FIELDS:
+            value = env.get(name)
+            setattr(self, name, default if value is None else cast(value))
 
         # Limits
         self.MAX_PLAYLIST_SIZE = 100
@@ -179,8 +221,9 @@ class Config:
         self.MAX_SPEED = 2.0
         self.MIN_SPEED = 0.5
 
-    def get_db_url(self) -> str:
-        """Get database connection URL"""
+    @cached_property
+    def db_url(self) -> str:
+        """Database connection URL, built once"""
         if self.DB_TYPE == 'sqlite':
             return f"sqlite:///{self.DB_PATH}"
         elif self.DB_TYPE == 'postgresql':
@@ -188,8 +231,9 @@ class Config:
         else:
             raise ValueError(f"Unsupported database type: {self.DB_TYPE}")
 
-    def get_redis_url(self) -> Optional[str]:
-        """Get Redis connection URL"""
+    @cached_property
+    def redis_url(self) -> Optional[str]:
+        """Redis connection URL, built once"""
         if not self.REDIS_ENABLED:
             return None
         if self.REDIS_PASSWORD:
@@ -207,38 +251,110 @@ class Config:
         return True
 
 
-# Audio effect presets
-EFFECT_PRESETS = {
-    "bass_low": {"bass": 5, "description": "Subtle bass enhancement"},
-    "bass_medium": {"bass": 10, "description": "Moderate bass boost"},
-    "bass_high": {"bass": 15, "description": "Heavy bass boost"},
-    "bass_extreme": {"bass": 20, "description": "Maximum bass boost"},
-    "nightcore": {"speed": 1.3, "pitch": 1.3, "description": "Nightcore effect"},
-    "daycore": {"speed": 0.7, "pitch": 0.7, "description": "Daycore/Anti-nightcore"},
-    "karaoke": {"karaoke": True, "description": "Vocal removal"},
-    "echo": {"echo": 0.5, "description": "Echo effect"},
-    "3d": {"rotation": True, "description": "3D audio effect"},
-    "gaming": {"bass": 8, "clarity": True, "description": "Gaming optimized"}
-}
-
-# Platform configurations
-PLATFORM_CONFIG = {
-    "youtube": {
-        "name": "YouTube",
-        "emoji": BotEmojis.YOUTUBE,
-        "color": BotColors.ERROR_RED,
-        "max_duration": 10800  # 3 hours
-    },
-    "spotify": {
-        "name": "Spotify",
-        "emoji": BotEmojis.SPOTIFY,
-        "color": BotColors.NEON_GREEN,
-        "max_duration": 7200  # 2 hours
-    },
-    "soundcloud": {
-        "name": "SoundCloud",
-        "emoji": BotEmojis.SOUNDCLOUD,
-        "color": BotColors.NEON_ORANGE,
-        "max_duration": 7200  # 2 hours
-    }
-}
+class _FieldMapping:
+    """Dict-style reads (config['name'], .get, .keys) over NamedTuple fields"""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key in self._fields:
+                return getattr(self, key)
+            raise KeyError(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self):
+        return self._fields
+
+
+class _EffectPresetFields(NamedTuple):
+    description: str
+    bass: int = 0
+    speed: float = 1.0
+    pitch: float = 1.0
+    karaoke: bool = False
+    echo: float = 0.0
+    rotation: bool = False
+    clarity: bool = False
+
+
+class EffectPreset(_FieldMapping, _EffectPresetFields):
+    """Audio effect preset"""
+    __slots__ = ()
+
+
+class _PlatformConfigFields(NamedTuple):
+    name: str
+    emoji: str
+    color: int
+    max_duration: int
+
+
+class PlatformConfig(_FieldMapping, _PlatformConfigFields):
+    """Streaming platform display settings"""
+    __slots__ = ()
+
+
+# Audio effect presets (read-only)
+EFFECT_PRESETS: Mapping[str, EffectPreset] = MappingProxyType({
+    "bass_low": EffectPreset("Subtle bass enhancement", bass=5),
+    "bass_medium": EffectPreset("Moderate bass boost", bass=10),
+    "bass_high": EffectPreset("Heavy bass boost", bass=15),
+    "bass_extreme": EffectPreset("Maximum bass boost", bass=20),
+    "nightcore": EffectPreset("Nightcore effect", speed=1.3, pitch=1.3),
+    "daycore": EffectPreset("Daycore/Anti-nightcore", speed=0.7, pitch=0.7),
+    "karaoke": EffectPreset("Vocal removal", karaoke=True),
+    "echo": EffectPreset("Echo effect", echo=0.5),
+    "3d": EffectPreset("3D audio effect", rotation=True),
+    "gaming": EffectPreset("Gaming optimized", bass=8, clarity=True)
+})
+
+# Effect state bits for MusicPlayer.fx_mask
+FX_NIGHTCORE: Final[int] = 1 << 0
+FX_KARAOKE: Final[int] = 1 << 1
+FX_ECHO: Final[int] = 1 << 2
+FX_3D: Final[int] = 1 << 3
+FX_GAMING: Final[int] = 1 << 4
+FX_CINEMA: Final[int] = 1 << 5
+FX_PARTY: Final[int] = 1 << 6
+
+# Effect bit -> effect name, in display order (read-only)
+FX_NAMES: Mapping[int, str] = MappingProxyType({
+    FX_NIGHTCORE: "nightcore",
+    FX_KARAOKE: "karaoke",
+    FX_ECHO: "echo",
+    FX_3D: "3d",
+    FX_GAMING: "gaming",
+    FX_CINEMA: "cinema",
+    FX_PARTY: "party"
+})
+
+# Every possible fx_mask -> its effect names, so rendering is one index
+FX_MASK_NAMES: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(name for bit, name in FX_NAMES.items() if mask & bit)
+    for mask in range(1 << len(FX_NAMES))
+)
+
+# Platform configurations (read-only)
+PLATFORM_CONFIG: Mapping[str, PlatformConfig] = MappingProxyType({
+    "youtube": PlatformConfig(
+        name="YouTube",
+        emoji=BotEmojis.YOUTUBE,
+        color=BotColors.ERROR_RED,
+        max_duration=10800  # 3 hours
+    ),
+    "spotify": PlatformConfig(
+        name="Spotify",
+        emoji=BotEmojis.SPOTIFY,
+        color=BotColors.NEON_GREEN,
+        max_duration=7200  # 2 hours
+    ),
+    "soundcloud": PlatformConfig(
+        name="SoundCloud",
+        emoji=BotEmojis.SOUNDCLOUD,
+        color=BotColors.NEON_ORANGE,
+        max_duration=7200  # 2 hours
+    )
+})
@@ -5,12 +5,14 @@ Gaming-inspired design with professional architecture
 
 import os
 import sys
+import time
 import asyncio
 import discord
 from discord.ext import commands
-from datetime import datetime
 import aiohttp
 import logging
+from typing import Optional
+from cachetools import TTLCache
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,31 +20,51 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from bot.config import Config, BotColors, BotEmojis
 from database.manager import DatabaseManager
 from utils.logger import setup_logger
-from web.dashboard import create_app
 from core.cache_manager import CacheManager
 
 # Setup logging
 logger = setup_logger('KazeBeats')
 
+# Ready banner, rendered lazily by the logger
+_READY_BANNER = """
+╔══════════════════════════════════════════╗
+║         🎮 KAZEBEATS IS ONLINE 🎮        ║
+╠══════════════════════════════════════════╣
+║  Bot Name: %-29s ║
+║  Bot ID: %-31s ║
+║  Servers: %-31s ║
+║  Users: %-33s ║
+║  Version: %-31s ║
+║  Prefix: %-32s ║
+╚══════════════════════════════════════════╝
+"""
+
 
 class KazeBeats(commands.Bot):
     """Main bot class with gaming-inspired features"""
 
     def __init__(self):
         # Load configuration
-        self.config = Config()
-        self.start_time = datetime.utcnow()
+        self.config = Config.instance()
+        self.start_time = discord.utils.utcnow()
+        self.start_monotonic = time.monotonic()
 
         # Initialize database
         self.db = DatabaseManager(self.config.DB_PATH)
 
-        # Get custom prefixes from database
-        intents = discord.Intents.all()
+        # Only the gateway events a music bot actually uses
+        intents = discord.Intents.none()
+        intents.guilds = True
+        intents.voice_states = True
+        intents.messages = True
         intents.message_content = True
+        intents.reactions = True
 
         super().__init__(
             command_prefix=self.get_prefix,
             intents=intents,
+            member_cache_flags=discord.MemberCacheFlags.from_intents(intents),  # Voice members only
+            chunk_guilds_at_startup=False,
             help_command=None,  # Custom help command
             description=self.config.BOT_DESCRIPTION,
             activity=discord.Activity(
@@ -56,34 +78,98 @@ class KazeBeats(commands.Bot):
         self.session = None
         self.cache = CacheManager(max_size_mb=self.config.CACHE_SIZE_MB)
         self.web_app = None
+        self._prefix_cache = {}  # guild_id -> custom prefix, loaded in setup_hook
+
+        # Static part of the welcome message, only the guild name varies
+        prefix = self.config.DEFAULT_PREFIX
+        self._welcome_tail = (
+            f"\n\n"
+            f"🎵 **Quick Start:**\n"
+            f"`{prefix}play <song>` - Play a song\n"
+            f"`{prefix}help` - Show all commands\n"
+            f"`{prefix}settings` - Configure bot\n\n"
+            f"🎮 **Features:**\n"
+            f"• Zero-lag streaming\n"
+            f"• Multi-platform support\n"
+            f"• Audio effects\n"
+            f"• Web dashboard\n\n"
+            f"💡 **Tip:** Server admins can change my prefix with "
+            f"`{prefix}setprefix <new_prefix>`"
+        )
 
         # Bot statistics
         self.commands_executed = 0
         self.songs_played = 0
-        self.total_users = set()
+        self.total_users = TTLCache(maxsize=100_000, ttl=86_400)  # Users seen in the last 24h
+
+        # Error embeds: type -> (template, description builder, delete_after)
+        self._error_templates = {
+            commands.MissingPermissions: (
+                discord.Embed(title="❌ Missing Permissions", color=BotColors.ERROR_RED),
+                lambda e: f"You need `{', '.join(e.missing_permissions)}` permission(s) to use this command.",
+                10
+            ),
+            commands.BotMissingPermissions: (
+                discord.Embed(title="❌ Bot Missing Permissions", color=BotColors.ERROR_RED),
+                lambda e: f"I need `{', '.join(e.missing_permissions)}` permission(s) to execute this command.",
+                10
+            ),
+            commands.CommandOnCooldown: (
+                discord.Embed(title="⏰ Command on Cooldown", color=BotColors.WARNING_YELLOW),
+                lambda e: f"Please wait `{e.retry_after:.1f}` seconds before using this command again.",
+                5
+            ),
+        }
+        self._unhandled_error_embed = discord.Embed(
+            title="❌ An Error Occurred",
+            description="An unexpected error occurred. Please try again later.",
+            color=BotColors.ERROR_RED
+        )
+
+    @property
+    def uptime(self) -> float:
+        """Seconds since startup, immune to wall-clock jumps"""
+        return time.monotonic() - self.start_monotonic
 
     async def get_prefix(self, message):
         """Get custom prefix for each guild"""
         if not message.guild:
             return self.config.DEFAULT_PREFIX
 
-        # Get custom prefix from database
-        custom_prefix = await self.db.get_guild_prefix(message.guild.id)
-        return custom_prefix or self.config.DEFAULT_PREFIX
+        # Every custom prefix is in memory, so no await on the message hot path
+        return self._prefix_cache.get(message.guild.id, self.config.DEFAULT_PREFIX)
+
+    def cache_prefix(self, guild_id: int, prefix: Optional[str]):
+        """Update the in-memory prefix after it changes (None resets to default)"""
+        if prefix is None:
+            self._prefix_cache.pop(guild_id, None)
+        else:
+            self._prefix_cache[guild_id] = prefix
 
     async def setup_hook(self):
         """Setup bot components"""
         logger.info("🚀 Initializing KazeBeats...")
 
-        # Create aiohttp session
-        self.session = aiohttp.ClientSession()
+        # Create aiohttp session with keep-alive and DNS caching for metadata fetches
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=30,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            keepalive_timeout=75
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+
+        # Setup database tables and load custom prefixes
+        await self.db.setup()
+        self._prefix_cache = await self.db.get_guild_prefixes()
 
         # Load cogs
         await self.load_extensions()
 
-        # Setup database tables
-        await self.db.setup()
-
         # Start web dashboard if enabled
         if self.config.WEB_ENABLED:
             self.web_app = await self.start_web_dashboard()
@@ -100,16 +186,23 @@ class KazeBeats(commands.Bot):
             'cogs.settings'
         ]
 
-        for cog in cogs:
-            try:
-                await self.load_extension(f"src.{cog}")
+        # Music registers first since other cogs look it up; the rest load concurrently
+        results = await asyncio.gather(self.load_extension(f"src.{cogs[0]}"), return_exceptions=True)
+        results += await asyncio.gather(
+            *(self.load_extension(f"src.{cog}") for cog in cogs[1:]),
+            return_exceptions=True
+        )
+
+        for cog, result in zip(cogs, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Failed to load {cog}: {result}")
+            else:
                 logger.info(f"✅ Loaded {cog}")
-            except Exception as e:
-                logger.error(f"❌ Failed to load {cog}: {e}")
 
     async def start_web_dashboard(self):
         """Start web dashboard"""
         from aiohttp import web
+        from web.dashboard import create_app
         app = create_app(self)
         runner = web.AppRunner(app)
         await runner.setup()
@@ -124,18 +217,17 @@ class KazeBeats(commands.Bot):
 
     async def on_ready(self):
         """Bot ready event"""
-        logger.info(f"""
-╔══════════════════════════════════════════╗
-║         🎮 KAZEBEATS IS ONLINE 🎮        ║
-╠══════════════════════════════════════════╣
-║  Bot Name: {self.user.name:<29} ║
-║  Bot ID: {self.user.id:<31} ║
-║  Servers: {len(self.guilds):<31} ║
-║  Users: {len(self.users):<33} ║
-║  Version: {self.config.BOT_VERSION:<31} ║
-║  Prefix: {self.config.DEFAULT_PREFIX:<32} ║
-╚══════════════════════════════════════════╝
-        """)
+        # on_ready fires again on every reconnect, skip the banner if nobody will see it
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                _READY_BANNER,
+                self.user.name,
+                self.user.id,
+                len(self.guilds),
+                len(self.users),
+                self.config.BOT_VERSION,
+                self.config.DEFAULT_PREFIX
+            )
 
         # Sync commands
         try:
@@ -146,27 +238,14 @@ class KazeBeats(commands.Bot):
 
     async def on_guild_join(self, guild):
         """When bot joins a new guild"""
-        logger.info(f"🎉 Joined guild: {guild.name} ({guild.id})")
+        logger.info("🎉 Joined guild: %s (%s)", guild.name, guild.id)
 
         # Send welcome message
         embed = discord.Embed(
             title="🎮 KazeBeats Has Arrived!",
-            description=(
-                f"Thanks for inviting me to **{guild.name}**!\n\n"
-                f"🎵 **Quick Start:**\n"
-                f"`{self.config.DEFAULT_PREFIX}play <song>` - Play a song\n"
-                f"`{self.config.DEFAULT_PREFIX}help` - Show all commands\n"
-                f"`{self.config.DEFAULT_PREFIX}settings` - Configure bot\n\n"
-                f"🎮 **Features:**\n"
-                f"• Zero-lag streaming\n"
-                f"• Multi-platform support\n"
-                f"• Audio effects\n"
-                f"• Web dashboard\n\n"
-                f"💡 **Tip:** Server admins can change my prefix with "
-                f"`{self.config.DEFAULT_PREFIX}setprefix <new_prefix>`"
-            ),
+            description=f"Thanks for inviting me to **{guild.name}**!{self._welcome_tail}",
             color=BotColors.NEON_BLUE,
-            timestamp=datetime.utcnow()
+            timestamp=discord.utils.utcnow()
         )
         embed.set_thumbnail(url=self.user.display_avatar.url)
         embed.set_footer(text="Gaming-inspired music experience")
@@ -178,69 +257,46 @@ class KazeBeats(commands.Bot):
     async def on_command(self, ctx):
         """Track command usage"""
         self.commands_executed += 1
-        self.total_users.add(ctx.author.id)
+        self.total_users[ctx.author.id] = True
 
         logger.info(
-            f"Command: {ctx.command.name} | "
-            f"User: {ctx.author} | "
-            f"Guild: {ctx.guild.name if ctx.guild else 'DM'}"
+            "Command: %s | User: %s | Guild: %s",
+            ctx.command.name,
+            ctx.author,
+            ctx.guild.name if ctx.guild else 'DM'
         )
 
     async def on_command_error(self, ctx, error):
         """Global error handler"""
-        if isinstance(error, commands.CommandNotFound):
+        # Ignore unknown commands and errors a cog handler already reported
+        if isinstance(error, commands.CommandNotFound) or getattr(ctx, 'error_handled', False):
             return
 
-        elif isinstance(error, commands.MissingPermissions):
-            embed = discord.Embed(
-                title="❌ Missing Permissions",
-                description=f"You need `{', '.join(error.missing_permissions)}` permission(s) to use this command.",
-                color=BotColors.ERROR_RED
-            )
-            await ctx.send(embed=embed, delete_after=10)
-
-        elif isinstance(error, commands.BotMissingPermissions):
-            embed = discord.Embed(
-                title="❌ Bot Missing Permissions",
-                description=f"I need `{', '.join(error.missing_permissions)}` permission(s) to execute this command.",
-                color=BotColors.ERROR_RED
-            )
-            await ctx.send(embed=embed, delete_after=10)
-
-        elif isinstance(error, commands.CommandOnCooldown):
-            embed = discord.Embed(
-                title="⏰ Command on Cooldown",
-                description=f"Please wait `{error.retry_after:.1f}` seconds before using this command again.",
-                color=BotColors.WARNING_YELLOW
-            )
-            await ctx.send(embed=embed, delete_after=5)
+        handler = self._error_templates.get(type(error))
+        if handler:
+            template, describe, delete_after = handler
+            embed = template.copy()
+            embed.description = describe(error)
+            await ctx.send(embed=embed, delete_after=delete_after)
+            return
 
-        else:
-            logger.error(f"Unhandled error in command {ctx.command}: {error}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ An Error Occurred",
-                description="An unexpected error occurred. Please try again later.",
-                color=BotColors.ERROR_RED
-            )
-            await ctx.send(embed=embed, delete_after=10)
+        logger.error("Unhandled error in command %s: %s", ctx.command, error, exc_info=True)
+        await ctx.send(embed=self._unhandled_error_embed, delete_after=10)
 
     async def close(self):
         """Cleanup on bot shutdown"""
         logger.info("🔄 Shutting down KazeBeats...")
 
-        # Close web dashboard
+        # Dashboard, HTTP session, database and cache are independent, close them together
+        cleanup = [self.db.close(), asyncio.to_thread(self.cache.clear)]
         if self.web_app:
-            await self.web_app.cleanup()
-
-        # Close aiohttp session
+            cleanup.append(self.web_app.cleanup())
         if self.session:
-            await self.session.close()
-
-        # Close database
-        await self.db.close()
+            cleanup.append(self.session.close())
 
-        # Clear cache
-        self.cache.clear()
+        for result in await asyncio.gather(*cleanup, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error("Cleanup error during shutdown: %s", result)
 
         await super().close()
         logger.info("👋 KazeBeats shutdown complete!")
@@ -248,6 +304,13 @@ class KazeBeats(commands.Bot):
 
 def main():
     """Main entry point"""
+    # Faster libuv-based event loop where available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         bot = KazeBeats()
         bot.run(bot.config.DISCORD_TOKEN)
@@ -2,21 +2,39 @@
 Admin commands for bot management
 """
 
+import asyncio
+import heapq
 import logging
 import sys
 import os
 import psutil
-from datetime import datetime
 from typing import Optional
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 
-from utils.helpers import format_time, humanize_number, confirm_action
+from utils.helpers import format_time, humanize_number, confirm_action, truncate_string
 from utils.decorators import log_command
 
 logger = logging.getLogger(__name__)
 
+# Static embeds, built once and sent as-is
+_EMBED_SHUTDOWN = discord.Embed(
+    title="🔌 Shutting Down",
+    description="Bot is shutting down...",
+    color=0xFF0000
+)
+_EMBED_RESTART = discord.Embed(
+    title="🔄 Restarting",
+    description="Bot is restarting...",
+    color=0xFFAA00
+)
+
+
+class ConfirmFlags(commands.FlagConverter):
+    """Pass `force: yes` to skip the confirmation prompt"""
+    force: bool = False
+
 
 class AdminCog(commands.Cog, name="Admin"):
     """Administrative commands for bot owners"""
@@ -24,39 +42,76 @@ class AdminCog(commands.Cog, name="Admin"):
     def __init__(self, bot):
         self.bot = bot
         self.process = psutil.Process()
+        self.process.cpu_percent(interval=None)  # Prime the counter for non-blocking reads
+        self._member_total = sum(g.member_count or 0 for g in bot.guilds)
+
+        # Status text that never changes while the process runs
+        config = bot.config
+        self._version_value = (
+            f"**Bot:** v{config.BOT_VERSION}\n"
+            f"**Python:** {sys.version.split()[0]}\n"
+            f"**Discord.py:** {discord.__version__}"
+        )
+        self._env_value = (
+            f"**Mode:** {config.BOT_ENV}\n"
+            f"**Debug:** {'Yes' if config.DEBUG else 'No'}"
+        )
+        self._footer_text = config.BOT_NAME
+
+        # System metrics, sampled in the background for status
+        self._mem_mb = 0.0
+        self._cpu = 0.0
+        self._latency_ms = 0.0
+
+    async def cog_load(self):
+        self._update_metrics.start()
+
+    async def cog_unload(self):
+        self._update_metrics.cancel()
 
     async def cog_check(self, ctx):
         """Check if user is bot owner"""
         return await self.bot.is_owner(ctx.author)
 
+    @tasks.loop(seconds=5)
+    async def _update_metrics(self):
+        """Sample process metrics so status only reads cached values"""
+        self._mem_mb = self.process.memory_info().rss / 1048576
+        self._cpu = self.process.cpu_percent(interval=None)
+        self._latency_ms = self.bot.latency * 1000
+
+    # Member total, kept up to date instead of summed per status call
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """Recount members once the guild cache is (re)populated"""
+        self._member_total = sum(g.member_count or 0 for g in self.bot.guilds)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild):
+        self._member_total += guild.member_count or 0
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self._member_total -= guild.member_count or 0
+
     @commands.command(name='shutdown', aliases=['kill'])
     @log_command()
-    async def shutdown(self, ctx):
+    async def shutdown(self, ctx, *, flags: ConfirmFlags):
         """Shutdown the bot"""
-        if await confirm_action(ctx, "Are you sure you want to shutdown the bot?"):
-            embed = discord.Embed(
-                title="🔌 Shutting Down",
-                description="Bot is shutting down...",
-                color=0xFF0000
-            )
-            await ctx.send(embed=embed)
+        if flags.force or await confirm_action(ctx, "Are you sure you want to shutdown the bot?"):
+            await ctx.send(embed=_EMBED_SHUTDOWN)
 
-            logger.info(f"Shutdown initiated by {ctx.author}")
+            logger.info("Shutdown initiated by %s", ctx.author)
             await self.bot.close()
 
     @commands.command(name='restart')
     @log_command()
-    async def restart(self, ctx):
+    async def restart(self, ctx, *, flags: ConfirmFlags):
         """Restart the bot"""
-        if await confirm_action(ctx, "Are you sure you want to restart the bot?"):
-            embed = discord.Embed(
-                title="🔄 Restarting",
-                description="Bot is restarting...",
-                color=0xFFAA00
-            )
-            await ctx.send(embed=embed)
+        if flags.force or await confirm_action(ctx, "Are you sure you want to restart the bot?"):
+            await ctx.send(embed=_EMBED_RESTART)
 
-            logger.info(f"Restart initiated by {ctx.author}")
+            logger.info("Restart initiated by %s", ctx.author)
 
             # Restart using execv
             os.execv(sys.executable, ['python'] + sys.argv)
@@ -64,15 +119,7 @@ class AdminCog(commands.Cog, name="Admin"):
     @commands.command(name='status')
     async def status(self, ctx):
         """Show bot status and statistics"""
-        # Calculate uptime
-        uptime = datetime.utcnow() - self.bot.startup_time if self.bot.startup_time else None
-
-        # Get memory usage
-        memory_info = self.process.memory_info()
-        memory_usage = memory_info.rss / 1024 / 1024  # MB
-
-        # Get CPU usage
-        cpu_percent = self.process.cpu_percent(interval=1)
+        now = discord.utils.utcnow()
 
         # Count voice connections
         voice_connections = len(self.bot.voice_clients)
@@ -81,14 +128,14 @@ class AdminCog(commands.Cog, name="Admin"):
         embed = discord.Embed(
             title="📊 Bot Status",
             color=0x00FF88,
-            timestamp=datetime.utcnow()
+            timestamp=now
         )
 
         # Basic info
         embed.add_field(
             name="📈 Statistics",
             value=f"**Guilds:** {len(self.bot.guilds)}\n"
-                  f"**Users:** {sum(g.member_count for g in self.bot.guilds)}\n"
+                  f"**Users:** {self._member_total}\n"
                   f"**Voice:** {voice_connections} connections",
             inline=True
         )
@@ -96,38 +143,34 @@ class AdminCog(commands.Cog, name="Admin"):
         # System info
         embed.add_field(
             name="💻 System",
-            value=f"**CPU:** {cpu_percent:.1f}%\n"
-                  f"**Memory:** {memory_usage:.1f} MB\n"
-                  f"**Latency:** {self.bot.latency * 1000:.1f}ms",
+            value=f"**CPU:** {self._cpu:.1f}%\n"
+                  f"**Memory:** {self._mem_mb:.1f} MB\n"
+                  f"**Latency:** {self._latency_ms:.1f}ms",
             inline=True
         )
 
         # Uptime
-        if uptime:
-            embed.add_field(
-                name="⏱️ Uptime",
-                value=format_time(int(uptime.total_seconds())),
-                inline=True
-            )
+        embed.add_field(
+            name="⏱️ Uptime",
+            value=format_time(int(self.bot.uptime)),
+            inline=True
+        )
 
         # Version info
         embed.add_field(
             name="📦 Version",
-            value=f"**Bot:** v{self.bot.config.bot_version}\n"
-                  f"**Python:** {sys.version.split()[0]}\n"
-                  f"**Discord.py:** {discord.__version__}",
+            value=self._version_value,
             inline=True
         )
 
         # Environment
         embed.add_field(
             name="🌍 Environment",
-            value=f"**Mode:** {self.bot.config.environment}\n"
-                  f"**Debug:** {'Yes' if self.bot.config.debug else 'No'}",
+            value=self._env_value,
             inline=True
         )
 
-        embed.set_footer(text=f"{self.bot.config.bot_name}")
+        embed.set_footer(text=self._footer_text)
 
         await ctx.send(embed=embed)
 
@@ -151,16 +194,15 @@ class AdminCog(commands.Cog, name="Admin"):
                     color=0xFF0000
                 )
         else:
-            # Reload all cogs
-            success = []
-            failed = []
+            # Reload all cogs concurrently
+            extensions = list(self.bot.extensions)
+            results = await asyncio.gather(
+                *(self.bot.reload_extension(ext) for ext in extensions),
+                return_exceptions=True
+            )
 
-            for extension in list(self.bot.extensions):
-                try:
-                    await self.bot.reload_extension(extension)
-                    success.append(extension)
-                except Exception as e:
-                    failed.append((extension, str(e)))
+            success = [ext for ext, result in zip(extensions, results) if not isinstance(result, Exception)]
+            failed = [(ext, str(result)) for ext, result in zip(extensions, results) if isinstance(result, Exception)]
 
             embed = discord.Embed(
                 title="🔄 Reload Complete",
@@ -186,29 +228,32 @@ class AdminCog(commands.Cog, name="Admin"):
     @commands.command(name='guilds')
     async def guilds(self, ctx):
         """List all guilds the bot is in"""
-        guilds = sorted(self.bot.guilds, key=lambda g: g.member_count, reverse=True)
+        total = len(self.bot.guilds)
+        top_guilds = heapq.nlargest(10, self.bot.guilds, key=lambda g: g.member_count or 0)
 
         embed = discord.Embed(
-            title=f"📋 Guilds ({len(guilds)})",
+            title=f"📋 Guilds ({total})",
             color=0x00FF88
         )
 
-        # Show top 10 guilds
-        for i, guild in enumerate(guilds[:10], 1):
-            embed.add_field(
-                name=f"{i}. {guild.name}",
-                value=f"ID: {guild.id}\nMembers: {guild.member_count}",
-                inline=True
-            )
+        # Show top 10 guilds in a single field
+        embed.add_field(
+            name="Top Guilds",
+            value=truncate_string("\n".join(
+                f"**{i}. {guild.name}** — {guild.member_count} members (`{guild.id}`)"
+                for i, guild in enumerate(top_guilds, 1)
+            ), 1024) or "None",
+            inline=False
+        )
 
-        if len(guilds) > 10:
-            embed.set_footer(text=f"...and {len(guilds) - 10} more")
+        if total > 10:
+            embed.set_footer(text=f"...and {total - 10} more")
 
         await ctx.send(embed=embed)
 
     @commands.command(name='leave')
     @log_command()
-    async def leave_guild(self, ctx, guild_id: int):
+    async def leave_guild(self, ctx, guild_id: int, *, flags: ConfirmFlags):
         """Make the bot leave a guild"""
         guild = self.bot.get_guild(guild_id)
 
@@ -221,7 +266,7 @@ class AdminCog(commands.Cog, name="Admin"):
             await ctx.send(embed=embed)
             return
 
-        if await confirm_action(ctx, f"Leave guild **{guild.name}**?"):
+        if flags.force or await confirm_action(ctx, f"Leave guild **{guild.name}**?"):
             await guild.leave()
             embed = discord.Embed(
                 title="✅ Left Guild",
@@ -248,10 +293,12 @@ class AdminCog(commands.Cog, name="Admin"):
 Playlist management commands
 """
 
+import asyncio
 import logging
 from typing import Optional, List
 
 import discord
+import wavelink
 from discord.ext import commands
 
 from utils.helpers import truncate_string, paginate_list, confirm_action
@@ -260,6 +307,69 @@ from utils.decorators import log_command, typing
 logger = logging.getLogger(__name__)
 
 
+def _first_playable(result) -> Optional[wavelink.Playable]:
+    """First track of a Playable.search result, None for errors and empty results"""
+    if isinstance(result, BaseException) or not result:
+        return None
+    if isinstance(result, wavelink.Playlist):
+        return result.tracks[0] if result.tracks else None
+    return result[0]
+
+
+# Static embeds, built once and sent as-is
+_EMBED_NO_DB = discord.Embed(
+    title="❌ Database Not Available",
+    description="Playlist feature requires database",
+    color=0xFF0000
+)
+_EMBED_NAME_TOO_LONG = discord.Embed(
+    title="❌ Name Too Long",
+    description="Playlist name must be under 100 characters",
+    color=0xFF0000
+)
+_EMBED_CREATE_FAILED = discord.Embed(
+    title="❌ Error",
+    description="Failed to create playlist",
+    color=0xFF0000
+)
+_EMBED_NOTHING_PLAYING = discord.Embed(
+    title="❌ Nothing Playing",
+    description="No track currently playing to add",
+    color=0xFF0000
+)
+_EMBED_PLAYLIST_HELP = discord.Embed(
+    title="📋 Playlist Commands",
+    description="Manage your playlists",
+    color=0x00FF88
+).add_field(
+    name="Commands",
+    value="`create <name>` - Create a playlist\n"
+          "`delete <name>` - Delete a playlist\n"
+          "`list` - List your playlists\n"
+          "`add <name>` - Add current track to playlist\n"
+          "`play <name>` - Play a playlist\n"
+          "`show <name>` - Show playlist tracks\n"
+          "`share <name>` - Make playlist public",
+    inline=False
+)
+
+# Templates, copied and given a description per use
+_TEMPLATE_NOT_FOUND = discord.Embed(title="❌ Playlist Not Found", color=0xFF0000)
+
+
+class DatabaseUnavailable(commands.CheckFailure):
+    """Raised when a playlist command runs without a database"""
+
+
+def _db_required():
+    """Only run the command when the playlist database is available"""
+    def predicate(ctx):
+        if ctx.cog.db is None:
+            raise DatabaseUnavailable()
+        return True
+    return commands.check(predicate)
+
+
 class PlaylistCog(commands.Cog, name="Playlist"):
     """Playlist management commands"""
 
@@ -267,51 +377,26 @@ class PlaylistCog(commands.Cog, name="Playlist"):
         self.bot = bot
         self.db = bot.db
 
+    async def cog_command_error(self, ctx, error):
+        """Report a missing database once for every playlist command"""
+        if isinstance(error, DatabaseUnavailable):
+            ctx.error_handled = True
+            await ctx.send(embed=_EMBED_NO_DB)
+
     @commands.group(name='playlist', aliases=['pl'], invoke_without_command=True)
     async def playlist(self, ctx):
         """Playlist management commands"""
-        embed = discord.Embed(
-            title="📋 Playlist Commands",
-            description="Manage your playlists",
-            color=0x00FF88
-        )
-
-        embed.add_field(
-            name="Commands",
-            value="`create <name>` - Create a playlist\n"
-                  "`delete <name>` - Delete a playlist\n"
-                  "`list` - List your playlists\n"
-                  "`add <name>` - Add current track to playlist\n"
-                  "`play <name>` - Play a playlist\n"
-                  "`show <name>` - Show playlist tracks\n"
-                  "`share <name>` - Make playlist public",
-            inline=False
-        )
-
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_EMBED_PLAYLIST_HELP)
 
     @playlist.command(name='create')
+    @_db_required()
     @typing()
     @log_command()
     async def create_playlist(self, ctx, *, name: str):
         """Create a new playlist"""
-        if not self.db:
-            embed = discord.Embed(
-                title="❌ Database Not Available",
-                description="Playlist feature requires database",
-                color=0xFF0000
-            )
-            await ctx.send(embed=embed)
-            return
-
         # Check name length
         if len(name) > 100:
-            embed = discord.Embed(
-                title="❌ Name Too Long",
-                description="Playlist name must be under 100 characters",
-                color=0xFF0000
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_EMBED_NAME_TOO_LONG)
             return
 
         try:
@@ -332,32 +417,21 @@ class PlaylistCog(commands.Cog, name="Playlist"):
 
             await ctx.send(embed=embed)
 
-        except Exception as e:
-            logger.error(f"Error creating playlist: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Failed to create playlist",
-                color=0xFF0000
-            )
-            await ctx.send(embed=embed)
+        except Exception:
+            logger.exception("Error creating playlist")
+            await ctx.send(embed=_EMBED_CREATE_FAILED)
 
     @playlist.command(name='delete')
+    @_db_required()
     @log_command()
     async def delete_playlist(self, ctx, *, name: str):
         """Delete a playlist"""
-        if not self.db:
-            return await ctx.send("❌ Database not available")
-
-        # Get user playlists
-        playlists = await self.db.get_user_playlists(ctx.author.id)
-        playlist = next((p for p in playlists if p.name.lower() == name.lower()), None)
+        # Get user playlist
+        playlist = await self.db.get_user_playlist_by_name(ctx.author.id, name)
 
         if not playlist:
-            embed = discord.Embed(
-                title="❌ Playlist Not Found",
-                description=f"You don't have a playlist named **{name}**",
-                color=0xFF0000
-            )
+            embed = _TEMPLATE_NOT_FOUND.copy()
+            embed.description = f"You don't have a playlist named **{name}**"
             await ctx.send(embed=embed)
             return
 
@@ -373,12 +447,10 @@ class PlaylistCog(commands.Cog, name="Playlist"):
             await ctx.send(embed=embed)
 
     @playlist.command(name='list')
+    @_db_required()
     async def list_playlists(self, ctx):
         """List your playlists"""
-        if not self.db:
-            return await ctx.send("❌ Database not available")
-
-        playlists = await self.db.get_user_playlists(ctx.author.id)
+        playlists = await self.db.get_user_playlists_with_counts(ctx.author.id)
 
         if not playlists:
             embed = discord.Embed(
@@ -395,15 +467,16 @@ class PlaylistCog(commands.Cog, name="Playlist"):
             color=0x00FF88
         )
 
-        for playlist in playlists[:10]:
-            tracks = await self.db.get_playlist_tracks(playlist.id)
-            embed.add_field(
-                name=playlist.name,
-                value=f"Tracks: {len(tracks)}\n"
-                      f"Created: {playlist.created_at.strftime('%Y-%m-%d')}\n"
-                      f"{'🌍 Public' if playlist.is_public else '🔒 Private'}",
-                inline=True
-            )
+        embed.add_field(
+            name="Playlists",
+            value=truncate_string("\n".join(
+                f"**{playlist.name}** — {track_count} tracks • "
+                f"{playlist.created_at.strftime('%Y-%m-%d')} • "
+                f"{'🌍 Public' if playlist.is_public else '🔒 Private'}"
+                for playlist, track_count in playlists[:10]
+            ), 1024),
+            inline=False
+        )
 
         if len(playlists) > 10:
             embed.set_footer(text=f"...and {len(playlists) - 10} more")
@@ -411,34 +484,23 @@ class PlaylistCog(commands.Cog, name="Playlist"):
         await ctx.send(embed=embed)
 
     @playlist.command(name='add')
+    @_db_required()
     @log_command()
     async def add_to_playlist(self, ctx, *, name: str):
         """Add current track to playlist"""
-        if not self.db:
-            return await ctx.send("❌ Database not available")
-
         # Get current track
         player = self.bot.get_cog('Music').get_player(ctx.guild)
 
         if not player or not player.current:
-            embed = discord.Embed(
-                title="❌ Nothing Playing",
-                description="No track currently playing to add",
-                color=0xFF0000
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_EMBED_NOTHING_PLAYING)
             return
 
         # Get playlist
-        playlists = await self.db.get_user_playlists(ctx.author.id)
-        playlist = next((p for p in playlists if p.name.lower() == name.lower()), None)
+        playlist = await self.db.get_user_playlist_by_name(ctx.author.id, name)
 
         if not playlist:
-            embed = discord.Embed(
-                title="❌ Playlist Not Found",
-                description=f"You don't have a playlist named **{name}**",
-                color=0xFF0000
-            )
+            embed = _TEMPLATE_NOT_FOUND.copy()
+            embed.description = f"You don't have a playlist named **{name}**"
             await ctx.send(embed=embed)
             return
 
@@ -462,22 +524,16 @@ class PlaylistCog(commands.Cog, name="Playlist"):
         await ctx.send(embed=embed)
 
     @playlist.command(name='play')
+    @_db_required()
     @log_command()
     async def play_playlist(self, ctx, *, name: str):
         """Play a playlist"""
-        if not self.db:
-            return await ctx.send("❌ Database not available")
-
         # Get playlist
-        playlists = await self.db.get_user_playlists(ctx.author.id)
-        playlist = next((p for p in playlists if p.name.lower() == name.lower()), None)
+        playlist = await self.db.get_user_playlist_by_name(ctx.author.id, name)
 
         if not playlist:
-            embed = discord.Embed(
-                title="❌ Playlist Not Found",
-                description=f"You don't have a playlist named **{name}**",
-                color=0xFF0000
-            )
+            embed = _TEMPLATE_NOT_FOUND.copy()
+            embed.description = f"You don't have a playlist named **{name}**"
             await ctx.send(embed=embed)
             return
 
@@ -493,37 +549,37 @@ class PlaylistCog(commands.Cog, name="Playlist"):
             await ctx.send(embed=embed)
             return
 
-        # Get music cog and player
+        if not ctx.author.voice:
+            return await ctx.send("❌ You need to be in a voice channel to play a playlist")
+
         music_cog = self.bot.get_cog('Music')
-        if not music_cog:
-            return await ctx.send("❌ Music system not available")
-
-        player = music_cog.get_player(ctx.guild)
-
-        # Queue all tracks
-        for track_data in tracks:
-            from cogs.music import Track
-            track = Track(
-                url=track_data.track_url,
-                title=track_data.track_title,
-                duration=track_data.track_duration or 0,
-                thumbnail=track_data.track_thumbnail,
-                requester=ctx.author,
-                source='Playlist',
-                artist=track_data.track_artist
-            )
-            player.queue.append(track)
+        if music_cog is None:
+            return await ctx.send("❌ Music system is not loaded")
+
+        # Get or create player
+        player = ctx.voice_client
+        if not player:
+            player = await ctx.author.voice.channel.connect(cls=music_cog.player_cls)
+            player.ctx = ctx
+
+        # Resolve the stored URLs concurrently, then queue them in one go
+        results = await asyncio.gather(
+            *(wavelink.Playable.search(track_data.track_url) for track_data in tracks),
+            return_exceptions=True
+        )
+        playables = [playable for playable in map(_first_playable, results) if playable]
+        added = await player.queue.extend(playables, requester=ctx.author)
 
         embed = discord.Embed(
             title="📋 Playlist Loaded",
-            description=f"Added **{len(tracks)}** tracks from **{playlist.name}**",
+            description=f"Added **{added}** tracks from **{playlist.name}**",
             color=0x00FF88
         )
         await ctx.send(embed=embed)
 
         # Start playing if not already
-        if not player.is_playing:
-            await ctx.invoke(music_cog.join)
+        if not player.playing and not player.queue.is_empty:
+            await player.play(await player.queue.get())
 
 
 # src/cogs/effects.py
@@ -531,6 +587,8 @@ class PlaylistCog(commands.Cog, name="Playlist"):
 Audio effects commands
 """
 
+import asyncio
+import functools
 import logging
 from typing import Optional
 
@@ -542,6 +600,21 @@ from utils.decorators import bot_in_voice, same_voice_channel, log_command
 
 logger = logging.getLogger(__name__)
 
+# Bass boost level bars, one per level 0-20
+_BASS_BARS = tuple('█' * i + '░' * (20 - i) for i in range(21))
+
+# Available effects: (name, command, player.effects key, description)
+_EFFECTS_LIST = (
+    ("🔊 Bass Boost", "bassboost <0-20>", "bass_boost", "Enhance bass frequencies"),
+    ("🎤 Karaoke", "karaoke", "karaoke", "Remove vocals from track"),
+    ("⚡ Nightcore", "nightcore", "nightcore", "Speed up and pitch up"),
+    ("🌊 Vaporwave", "vaporwave", "vaporwave", "Slow down and pitch down"),
+    ("🎧 3D Audio", "3d", "3d", "Surround sound effect"),
+    ("🔊 Echo", "echo", "echo", "Add echo/reverb"),
+    ("🎚️ Tremolo", "tremolo", "tremolo", "Volume oscillation"),
+    ("🎵 Vibrato", "vibrato", "vibrato", "Pitch oscillation"),
+)
+
 
 class EffectsCog(commands.Cog, name="Effects"):
     """Audio effects commands"""
@@ -549,10 +622,26 @@ class EffectsCog(commands.Cog, name="Effects"):
     def __init__(self, bot):
         self.bot = bot
         self.processor = AudioProcessor(bot.config)
+        self._music = None  # Music cog, resolved on first use and dropped when it unloads
+
+    async def _add_effect(self, name: str, **kwargs):
+        """Build an effect filter in the default executor so ffmpeg setup can't stall the gateway"""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.processor.add_effect, name, **kwargs)
+        )
+
+    @commands.Cog.listener()
+    async def on_music_cog_unload(self, music_cog):
+        """Forget the cached Music cog so a reloaded one is picked up"""
+        if self._music is music_cog:
+            self._music = None
 
     def get_player(self, guild):
         """Get player from music cog"""
-        music_cog = self.bot.get_cog('Music')
+        music_cog = self._music
+        if music_cog is None:
+            # Not cached until Music exists, so load order doesn't matter
+            music_cog = self._music = self.bot.get_cog('Music')
         if music_cog:
             return music_cog.get_player(guild)
         return None
@@ -571,16 +660,12 @@ class EffectsCog(commands.Cog, name="Effects"):
         level = max(0, min(20, level))
 
         # Apply effect
-        effect_filter = self.processor.add_effect('bass_boost', level=level)
+        effect_filter = await self._add_effect('bass_boost', level=level)
         if effect_filter:
-            if 'bass_boost' in player.effects:
-                player.effects.remove(player.effects[player.effects.index('bass_boost')])
-            player.effects.append(effect_filter)
+            player.set_processor_effect('bass_boost', effect_filter)
 
         # Create visualization
-        bar_length = 20
-        filled = int(bar_length * (level / 20))
-        bar = '█' * filled + '░' * (bar_length - filled)
+        bar = _BASS_BARS[level]
 
         embed = discord.Embed(
             title="🔊 Bass Boost",
@@ -602,14 +687,13 @@ class EffectsCog(commands.Cog, name="Effects"):
 
         # Toggle effect
         effect_name = 'karaoke'
-        if any(effect_name in e for e in player.effects):
-            player.effects = [e for e in player.effects if effect_name not in e]
+        if player.effects.get(effect_name):
+            player.set_processor_effect(effect_name, None)
             status = "disabled"
             emoji = "🎤❌"
         else:
-            effect_filter = self.processor.add_effect(effect_name)
-            if effect_filter:
-                player.effects.append(effect_filter)
+            effect_filter = await self._add_effect(effect_name)
+            player.set_processor_effect(effect_name, effect_filter)
             status = "enabled"
             emoji = "🎤✅"
 
@@ -633,14 +717,13 @@ class EffectsCog(commands.Cog, name="Effects"):
 
         # Toggle effect
         effect_name = 'nightcore'
-        if any(effect_name in e for e in player.effects):
-            player.effects = [e for e in player.effects if effect_name not in e]
+        if player.effects.get(effect_name):
+            player.set_processor_effect(effect_name, None)
             status = "disabled"
             emoji = "⚡❌"
         else:
-            effect_filter = self.processor.add_effect(effect_name)
-            if effect_filter:
-                player.effects.append(effect_filter)
+            effect_filter = await self._add_effect(effect_name)
+            player.set_processor_effect(effect_name, effect_filter)
             status = "enabled"
             emoji = "⚡✅"
 
@@ -664,14 +747,13 @@ class EffectsCog(commands.Cog, name="Effects"):
 
         # Toggle effect
         effect_name = 'vaporwave'
-        if any(effect_name in e for e in player.effects):
-            player.effects = [e for e in player.effects if effect_name not in e]
+        if player.effects.get(effect_name):
+            player.set_processor_effect(effect_name, None)
             status = "disabled"
             emoji = "🌊❌"
         else:
-            effect_filter = self.processor.add_effect(effect_name)
-            if effect_filter:
-                player.effects.append(effect_filter)
+            effect_filter = await self._add_effect(effect_name)
+            player.set_processor_effect(effect_name, effect_filter)
             status = "enabled"
             emoji = "🌊✅"
 
@@ -695,14 +777,13 @@ class EffectsCog(commands.Cog, name="Effects"):
 
         # Toggle effect
         effect_name = '3d'
-        if any(effect_name in e for e in player.effects):
-            player.effects = [e for e in player.effects if effect_name not in e]
+        if player.effects.get(effect_name):
+            player.set_processor_effect(effect_name, None)
             status = "disabled"
             emoji = "🎧❌"
         else:
-            effect_filter = self.processor.add_effect(effect_name)
-            if effect_filter:
-                player.effects.append(effect_filter)
+            effect_filter = await self._add_effect(effect_name)
+            player.set_processor_effect(effect_name, effect_filter)
             status = "enabled"
             emoji = "🎧✅"
 
@@ -726,13 +807,12 @@ class EffectsCog(commands.Cog, name="Effects"):
 
         # Toggle effect
         effect_name = 'echo'
-        if any(effect_name in e for e in player.effects):
-            player.effects = [e for e in player.effects if effect_name not in e]
+        if player.effects.get(effect_name):
+            player.set_processor_effect(effect_name, None)
             status = "disabled"
         else:
-            effect_filter = self.processor.add_effect(effect_name)
-            if effect_filter:
-                player.effects.append(effect_filter)
+            effect_filter = await self._add_effect(effect_name)
+            player.set_processor_effect(effect_name, effect_filter)
             status = "enabled"
 
         embed = discord.Embed(
@@ -754,8 +834,7 @@ class EffectsCog(commands.Cog, name="Effects"):
             return await ctx.send("❌ Music player not available")
 
         # Clear effects
-        effect_count = len(player.effects)
-        player.effects.clear()
+        effect_count = player.clear_processor_effects()
         self.processor.clear_effects()
 
         embed = discord.Embed(
@@ -777,27 +856,10 @@ class EffectsCog(commands.Cog, name="Effects"):
             color=0xFF00FF
         )
 
-        # Available effects
-        effects_list = [
-            ("🔊 Bass Boost", "bassboost <0-20>", "Enhance bass frequencies"),
-            ("🎤 Karaoke", "karaoke", "Remove vocals from track"),
-            ("⚡ Nightcore", "nightcore", "Speed up and pitch up"),
-            ("🌊 Vaporwave", "vaporwave", "Slow down and pitch down"),
-            ("🎧 3D Audio", "3d", "Surround sound effect"),
-            ("🔊 Echo", "echo", "Add echo/reverb"),
-            ("🎚️ Tremolo", "tremolo", "Volume oscillation"),
-            ("🎵 Vibrato", "vibrato", "Pitch oscillation"),
-        ]
-
-        for name, command, description in effects_list:
-            # Check if active
-            active = False
-            if player:
-                for effect in player.effects:
-                    if command.split()[0] in effect.lower():
-                        active = True
-                        break
+        active_effects = player.effects if player else {}
 
+        for name, command, key, description in _EFFECTS_LIST:
+            active = bool(active_effects.get(key))
             status = "✅ Active" if active else "⭕ Available"
             embed.add_field(
                 name=f"{name} {status}",
@@ -806,10 +868,11 @@ class EffectsCog(commands.Cog, name="Effects"):
             )
 
         # Current effects
-        if player and player.effects:
+        active_count = sum(1 for value in active_effects.values() if value)
+        if active_count:
             embed.add_field(
                 name="🎛️ Active Effects",
-                value=f"**{len(player.effects)}** effects active\n"
+                value=f"**{active_count}** effects active\n"
                       f"Use `{ctx.prefix}clearfx` to reset",
                 inline=False
             )
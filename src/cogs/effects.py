@@ -3,12 +3,179 @@ Audio effects cog with gaming-inspired presets
 Bass boost, nightcore, karaoke, and more
 """
 
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
 import discord
 from discord.ext import commands
 import wavelink
-from typing import Optional
-
-from bot.config import BotColors, BotEmojis, EFFECT_PRESETS
+from typing import Callable
+from cachetools import LRUCache, TTLCache
+
+from bot.config import (
+    BotColors, BotEmojis, FX_NAMES,
+    FX_NIGHTCORE, FX_KARAOKE, FX_ECHO, FX_3D, FX_GAMING, FX_CINEMA, FX_PARTY
+)
+from utils.helpers import DeleteScheduler
+
+# Preset equalizer band payloads for Equalizer.set(bands=...), built once at import
+_GAMING_BANDS = [
+    {"band": band, "gain": gain}
+    for band, gain in ((0, 0.15), (1, 0.1), (2, 0.05), (6, 0.05), (7, 0.1), (8, 0.1))
+]
+_MOVIE_BANDS = [
+    {"band": band, "gain": gain}
+    for band, gain in ((0, 0.2), (1, 0.15), (2, 0.1), (12, 0.1), (13, 0.15), (14, 0.2))
+]
+_PARTY_BANDS = [
+    {"band": band, "gain": gain}
+    for band, gain in ((0, 0.3), (1, 0.25), (2, 0.2), (3, 0.15), (4, 0.1))
+]
+
+# Effects menu fields: (name, value, inline)
+_MENU_FIELDS = (
+    (
+        f"{BotEmojis.BASS_BOOST} Bass Boost",
+        "`/effect bass <0-20>` - Adjust bass levels\n"
+        "• `5` - Subtle enhancement\n"
+        "• `10` - Moderate boost\n"
+        "• `15` - Heavy bass\n"
+        "• `20` - Maximum bass",
+        False
+    ),
+    (f"{BotEmojis.NIGHTCORE} Nightcore", "`/effect nightcore` - Speed up with pitch shift", True),
+    (f"{BotEmojis.KARAOKE} Karaoke", "`/effect karaoke` - Remove vocals", True),
+    (f"{BotEmojis.ECHO} Echo", "`/effect echo` - Add echo effect", True),
+    (f"{BotEmojis.THREE_D} 3D Audio", "`/effect 3d` - Spatial audio effect", True),
+    (
+        "🎮 Gaming Presets",
+        "`/effect preset gaming` - Optimized for gaming\n"
+        "`/effect preset movie` - Cinema experience\n"
+        "`/effect preset party` - Party mode",
+        False
+    ),
+    (
+        "⚙️ Commands",
+        "`/effect clear` - Remove all effects\n"
+        "`/effect show` - Show active effects\n"
+        "`/effect save <name>` - Save current as preset",
+        False
+    ),
+)
+
+# Per-band bass boost shape across the 15 equalizer bands, boosting lower frequencies more
+_BASS_WEIGHTS = tuple(1 - band * 0.1 if band < 6 else 0.0 for band in range(15))
+
+# Inclusive upper bass level for each description; anything above is maximum
+_BASS_THRESHOLDS = (0, 5, 10, 15)
+_BASS_DESCRIPTIONS = (
+    "Bass boost disabled",
+    "🎵 Subtle bass enhancement",
+    "🔊 Moderate bass boost",
+    "💥 Heavy bass boost",
+    "🌋 MAXIMUM BASS"
+)
+
+# Preset name -> (bands, bass boost level, fx_mask, title, description, color)
+_PRESET_MAP = {
+    "gaming": (
+        _GAMING_BANDS,
+        8,
+        FX_GAMING,
+        "🎮 Gaming Preset Applied",
+        "Optimized for gaming with enhanced bass and spatial clarity!",
+        BotColors.NEON_GREEN
+    ),
+    "movie": (
+        _MOVIE_BANDS,
+        10,
+        FX_CINEMA,
+        "🎬 Cinema Preset Applied",
+        "Experience theater-quality sound with enhanced bass and treble!",
+        BotColors.NEON_PURPLE
+    ),
+    "party": (
+        _PARTY_BANDS,
+        15,
+        FX_PARTY,
+        "🎉 Party Preset Applied",
+        "Maximum bass and energy for the ultimate party experience!",
+        BotColors.NEON_PINK
+    ),
+}
+_PRESET_MAP["cinema"] = _PRESET_MAP["movie"]
+
+
+@dataclass(slots=True, frozen=True)
+class ToggleSpec:
+    """How an on/off effect is applied and announced"""
+    bit: int
+    emoji: str
+    label: str
+    apply: Callable[[wavelink.Filters], None]
+    on_desc: str
+    off_desc: str
+    color: int
+
+
+_TOGGLES = {
+    "nightcore": ToggleSpec(
+        bit=FX_NIGHTCORE,
+        emoji=BotEmojis.NIGHTCORE,
+        label="Nightcore",
+        apply=lambda f: f.timescale.set(pitch=1.3, speed=1.3, rate=1),
+        on_desc="🌙 Speed and pitch increased by 30%",
+        off_desc="Effect removed",
+        color=BotColors.NIGHTCORE
+    ),
+    "karaoke": ToggleSpec(
+        bit=FX_KARAOKE,
+        emoji=BotEmojis.KARAOKE,
+        label="Karaoke Mode",
+        apply=lambda f: f.karaoke.set(level=1.0, mono_level=1.0, filter_band=220, filter_width=100),
+        on_desc="🎤 Vocals removed - sing along!",
+        off_desc="Vocals restored",
+        color=BotColors.KARAOKE
+    ),
+    # Note: Wavelink doesn't have direct echo, using channel mix for effect
+    "echo": ToggleSpec(
+        bit=FX_ECHO,
+        emoji=BotEmojis.ECHO,
+        label="Echo",
+        apply=lambda f: f.channel_mix.set(
+            left_to_left=1.0, left_to_right=0.0, right_to_left=0.0, right_to_right=1.0
+        ),
+        on_desc="🔄 Echo with {delay}s delay",
+        off_desc="Echo removed",
+        color=BotColors.ECHO
+    ),
+    "3d": ToggleSpec(
+        bit=FX_3D,
+        emoji=BotEmojis.THREE_D,
+        label="3D Audio",
+        apply=lambda f: f.rotation.set(rotation_hz=0.2),
+        on_desc="🎭 Spatial audio effect active",
+        off_desc="3D effect removed",
+        color=BotColors.THREE_D
+    ),
+}
+
+# Error embed key -> (title, description)
+_ERROR_TEMPLATES = {
+    "nothing_playing": ("Nothing Playing", "Play something first to apply effects!"),
+    "not_connected": ("Not Connected", "I'm not connected to a voice channel!"),
+    "effects_disabled": ("Effects Disabled", "Audio effects are disabled on this server!"),
+    "invalid_level": ("Invalid Level", "Bass boost must be between 0 and {max_bass}!"),
+    "invalid_delay": ("Invalid Delay", "Echo delay must be between 0.1 and 1.0 seconds!"),
+    "unknown_preset": ("Unknown Preset", "Available presets: `gaming`, `movie`, `party`"),
+    "no_effects": ("No Effects Active", "Apply some effects first before saving a preset!"),
+}
+
+# Seconds within which a new effect acknowledgement edits the previous one instead
+_ACK_WINDOW = 5.0
+
+# Seconds a guild's "effects" feature flag is trusted before re-reading the database
+_FEATURE_TTL = 60.0
 
 
 class Effects(commands.Cog):
@@ -19,24 +186,150 @@ class Effects(commands.Cog):
         self.emoji = BotEmojis()
         self.colors = BotColors()
 
+        # Bass boost equalizer band payloads for every legal level
+        self._bass_bands = tuple(
+            [
+                {"band": band, "gain": level * weight / 20}
+                for band, weight in enumerate(_BASS_WEIGHTS)
+            ]
+            for level in range(bot.config.MAX_BASS_BOOST + 1)
+        )
+
+        # Rendered intensity bar for every bass level
+        self._bass_bars = tuple(
+            self._render_effect_bar(level, bot.config.MAX_BASS_BOOST)
+            for level in range(bot.config.MAX_BASS_BOOST + 1)
+        )
+
+        # Shared error embeds, built from their dict templates
+        self._errors = {
+            key: discord.Embed.from_dict({
+                "title": f"{self.emoji.ERROR} {title}",
+                "description": description.format(max_bass=bot.config.MAX_BASS_BOOST),
+                "color": self.colors.ERROR_RED
+            })
+            for key, (title, description) in _ERROR_TEMPLATES.items()
+        }
+
+        # guild_id -> (effects enabled, expiry on the monotonic clock)
+        self._feature_cache = {}
+
+        # (user id, avatar key) -> avatar URL for embed footers
+        self._avatar_urls = LRUCache(maxsize=1024)
+
+        # channel_id -> last acknowledgement message, forgotten after the edit window
+        self._ack_messages = TTLCache(maxsize=1024, ttl=_ACK_WINDOW)
+
+        # Error replies are removed in batches rather than one timer each
+        self._deletes = DeleteScheduler()
+
+        # Effects menu embed, built on first use and rebuilt if the bot's avatar changes
+        self._menu_embed = None
+
+    async def cog_load(self):
+        """Start the batched error cleanup"""
+        self._deletes.start()
+
+    async def cog_unload(self):
+        """Stop the batched error cleanup"""
+        await self._deletes.close()
+
     async def cog_check(self, ctx):
         """Check if effects are enabled for this guild"""
         if not ctx.guild:
             return False
 
+        # Allowlisted guilds and the bot owner never need the database
+        config = self.bot.config
+        if ctx.guild.id in config.ALWAYS_ENABLED_GUILDS or ctx.author.id == config.OWNER_ID:
+            return True
+
         # Check if effects are enabled
-        effects_enabled = await self.bot.db.get_guild_feature(ctx.guild.id, "effects")
+        now = time.monotonic()
+        cached = self._feature_cache.get(ctx.guild.id)
+        if cached is not None and cached[1] > now:
+            effects_enabled = cached[0]
+        else:
+            effects_enabled = await self.bot.db.get_guild_feature(ctx.guild.id, "effects")
+            self._feature_cache[ctx.guild.id] = (effects_enabled, now + _FEATURE_TTL)
         if not effects_enabled:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Effects Disabled",
-                description="Audio effects are disabled on this server!",
-                color=self.colors.ERROR_RED
-            )
-            await ctx.send(embed=embed, delete_after=10)
+            await self._deletes.send(ctx, embed=self._errors["effects_disabled"])
             return False
 
         return True
 
+    @commands.Cog.listener()
+    async def on_guild_feature_toggle(self, guild_id: int, feature: str, enabled: bool):
+        """Forget the cached effects flag when a guild toggles it"""
+        if feature == "effects":
+            self._feature_cache.pop(guild_id, None)
+
+    @property
+    def _bot_avatar_url(self) -> str:
+        """The bot's own avatar URL, cached per avatar like any user's"""
+        return self._avatar_url(self.bot.user)
+
+    def _avatar_url(self, user) -> str:
+        """Footer icon URL for a user, cached per avatar"""
+        avatar = user.display_avatar
+        cache_key = (user.id, avatar.key)
+        url = self._avatar_urls.get(cache_key)
+        if url is None:
+            url = self._avatar_urls[cache_key] = avatar.url
+        return url
+
+    async def _send_ack(self, ctx, embed: discord.Embed):
+        """Acknowledge an effect change, editing a recent acknowledgement when possible"""
+        # Slash invocations must answer their own interaction
+        if ctx.interaction is None:
+            recent = self._ack_messages.get(ctx.channel.id)
+            if recent is not None:
+                try:
+                    await recent.edit(embed=embed)
+                    self._ack_messages[ctx.channel.id] = recent  # Restart the window
+                    return
+                except discord.HTTPException:
+                    pass
+
+        message = await ctx.send(embed=embed)
+        self._ack_messages[ctx.channel.id] = message
+
+    async def _apply_filters(self, player, signature, build: Callable[[], wavelink.Filters]):
+        """Send a filter set to the node unless it is already the active one
+
+        signature identifies the filter set (None means no filters); build is
+        only called when the set actually changes.
+        """
+        if signature == player.fx_signature:
+            return
+
+        # None makes wavelink give this player its own fresh Filters
+        await player.set_filters(None if signature is None else build())
+        player.fx_signature = signature
+
+    @staticmethod
+    def _equalizer_filters(bands) -> wavelink.Filters:
+        """Filters with only the given equalizer bands set"""
+        filters = wavelink.Filters()
+        filters.equalizer.set(bands=bands)
+        return filters
+
+    async def _guard_playing(self, ctx):
+        """Return the player if something is playing, otherwise report it"""
+        player = ctx.voice_client
+        if not player or not player.playing:
+            await self._deletes.send(ctx, embed=self._errors["nothing_playing"])
+            return None
+        return player
+
+    async def _guard_connected(self, ctx):
+        """Return the player if connected, otherwise report it"""
+        player = ctx.voice_client
+        if not player:
+            await self._deletes.send(ctx, embed=self._errors["not_connected"])
+            return None
+        return player
+
     @commands.hybrid_group(name="effect", aliases=["fx"], description="Audio effects control")
     async def effect(self, ctx):
         """Audio effects base command"""
@@ -45,121 +338,49 @@ class Effects(commands.Cog):
 
     async def show_effects_menu(self, ctx):
         """Show available effects menu"""
+        # discord.py never dispatches the bot's own user updates, so compare the footer icon instead
+        menu = self._menu_embed
+        if menu is None or menu.footer.icon_url != self._bot_avatar_url:
+            self._menu_embed = self._build_effects_menu()
+
+        await ctx.send(embed=self._menu_embed)
+
+    def _build_effects_menu(self) -> discord.Embed:
+        """Build the effects menu embed"""
         embed = discord.Embed(
             title=f"{self.emoji.LIGHTNING} Audio Effects Menu",
             description="Gaming-optimized audio effects for the ultimate experience!",
             color=self.colors.NEON_PURPLE
         )
 
-        # Bass Boost
-        embed.add_field(
-            name=f"{self.emoji.BASS_BOOST} Bass Boost",
-            value=(
-                "`/effect bass <0-20>` - Adjust bass levels\n"
-                "• `5` - Subtle enhancement\n"
-                "• `10` - Moderate boost\n"
-                "• `15` - Heavy bass\n"
-                "• `20` - Maximum bass"
-            ),
-            inline=False
-        )
-
-        # Nightcore
-        embed.add_field(
-            name=f"{self.emoji.NIGHTCORE} Nightcore",
-            value="`/effect nightcore` - Speed up with pitch shift",
-            inline=True
-        )
-
-        # Karaoke
-        embed.add_field(
-            name=f"{self.emoji.KARAOKE} Karaoke",
-            value="`/effect karaoke` - Remove vocals",
-            inline=True
-        )
-
-        # Echo
-        embed.add_field(
-            name=f"{self.emoji.ECHO} Echo",
-            value="`/effect echo` - Add echo effect",
-            inline=True
-        )
-
-        # 3D Audio
-        embed.add_field(
-            name=f"{self.emoji.THREE_D} 3D Audio",
-            value="`/effect 3d` - Spatial audio effect",
-            inline=True
-        )
-
-        # Presets
-        embed.add_field(
-            name="🎮 Gaming Presets",
-            value=(
-                "`/effect preset gaming` - Optimized for gaming\n"
-                "`/effect preset movie` - Cinema experience\n"
-                "`/effect preset party` - Party mode"
-            ),
-            inline=False
-        )
-
-        # Commands
-        embed.add_field(
-            name="⚙️ Commands",
-            value=(
-                "`/effect clear` - Remove all effects\n"
-                "`/effect show` - Show active effects\n"
-                "`/effect save <name>` - Save current as preset"
-            ),
-            inline=False
-        )
+        for name, value, inline in _MENU_FIELDS:
+            embed.add_field(name=name, value=value, inline=inline)
 
         embed.set_footer(
             text="🎮 Gaming Mode Active | Effects stack for ultimate customization",
-            icon_url=self.bot.user.display_avatar.url
+            icon_url=self._bot_avatar_url
         )
 
-        await ctx.send(embed=embed)
+        return embed
 
     @effect.command(name="bass", description="Adjust bass boost level")
     async def bass(self, ctx, level: int):
         """Set bass boost level (0-20)"""
-        player = ctx.voice_client
-
-        if not player or not player.playing:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Nothing Playing",
-                description="Play something first to apply effects!",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
+        player = await self._guard_playing(ctx)
+        if player is None:
+            return
 
         # Validate level
         if not 0 <= level <= self.bot.config.MAX_BASS_BOOST:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Invalid Level",
-                description=f"Bass boost must be between 0 and {self.bot.config.MAX_BASS_BOOST}!",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
+            return await self._deletes.send(ctx, embed=self._errors["invalid_level"])
 
         # Apply bass boost filter
-        filters = wavelink.Filters()
-
-        if level > 0:
-            # Calculate equalizer bands for bass boost
-            bands = []
-            for i in range(15):
-                if i < 6:  # Boost lower frequencies more
-                    gain = level * (1 - i * 0.1)
-                else:
-                    gain = 0
-                bands.append(wavelink.Equalizer(band=i, gain=gain / 20))
-
-            filters.equalizer.set(bands=bands)
-
-        await player.set_filters(filters)
-        player.effects["bass_boost"] = level
+        await self._apply_filters(
+            player,
+            ("bass", level) if level > 0 else None,
+            lambda: self._equalizer_filters(self._bass_bands[level])
+        )
+        player.set_effects(level, player.fx_mask)
 
         # Visual feedback
         bass_bar = self.create_effect_bar(level, self.bot.config.MAX_BASS_BOOST)
@@ -171,305 +392,105 @@ class Effects(commands.Cog):
         )
 
         # Add description based on level
-        if level == 0:
-            embed.add_field(name="Effect", value="Bass boost disabled", inline=False)
-        elif level <= 5:
-            embed.add_field(name="Effect", value="🎵 Subtle bass enhancement", inline=False)
-        elif level <= 10:
-            embed.add_field(name="Effect", value="🔊 Moderate bass boost", inline=False)
-        elif level <= 15:
-            embed.add_field(name="Effect", value="💥 Heavy bass boost", inline=False)
-        else:
-            embed.add_field(name="Effect", value="🌋 MAXIMUM BASS", inline=False)
+        embed.add_field(
+            name="Effect",
+            value=_BASS_DESCRIPTIONS[bisect_left(_BASS_THRESHOLDS, level)],
+            inline=False
+        )
 
-        embed.set_footer(text=f"Adjusted by {ctx.author}", icon_url=ctx.author.display_avatar.url)
+        embed.set_footer(text=f"Adjusted by {ctx.author}", icon_url=self._avatar_url(ctx.author))
 
-        await ctx.send(embed=embed)
+        await self._send_ack(ctx, embed)
 
     @effect.command(name="nightcore", description="Enable/disable nightcore effect")
     async def nightcore(self, ctx):
         """Toggle nightcore effect (speed + pitch up)"""
-        player = ctx.voice_client
-
-        if not player or not player.playing:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Nothing Playing",
-                description="Play something first to apply effects!",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
-
-        # Toggle nightcore
-        nightcore_enabled = not player.effects.get("nightcore", False)
-
-        filters = wavelink.Filters()
-
-        if nightcore_enabled:
-            filters.timescale.set(pitch=1.3, speed=1.3, rate=1)
-
-        await player.set_filters(filters)
-        player.effects["nightcore"] = nightcore_enabled
-
-        embed = discord.Embed(
-            title=f"{self.emoji.NIGHTCORE} Nightcore {'Enabled' if nightcore_enabled else 'Disabled'}",
-            description=(
-                "🌙 Speed and pitch increased by 30%" if nightcore_enabled
-                else "Effect removed"
-            ),
-            color=self.colors.NIGHTCORE if nightcore_enabled else self.colors.INFO_BLUE
-        )
-
-        embed.set_footer(text=f"Toggled by {ctx.author}", icon_url=ctx.author.display_avatar.url)
-
-        await ctx.send(embed=embed)
+        await self._do_toggle(ctx, "nightcore")
 
     @effect.command(name="karaoke", description="Enable/disable karaoke mode")
     async def karaoke(self, ctx):
         """Toggle karaoke mode (vocal removal)"""
-        player = ctx.voice_client
-
-        if not player or not player.playing:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Nothing Playing",
-                description="Play something first to apply effects!",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
-
-        # Toggle karaoke
-        karaoke_enabled = not player.effects.get("karaoke", False)
-
-        filters = wavelink.Filters()
-
-        if karaoke_enabled:
-            filters.karaoke.set(
-                level=1.0,
-                mono_level=1.0,
-                filter_band=220,
-                filter_width=100
-            )
-
-        await player.set_filters(filters)
-        player.effects["karaoke"] = karaoke_enabled
-
-        embed = discord.Embed(
-            title=f"{self.emoji.KARAOKE} Karaoke Mode {'Enabled' if karaoke_enabled else 'Disabled'}",
-            description=(
-                "🎤 Vocals removed - sing along!" if karaoke_enabled
-                else "Vocals restored"
-            ),
-            color=self.colors.KARAOKE if karaoke_enabled else self.colors.INFO_BLUE
-        )
-
-        embed.set_footer(text=f"Toggled by {ctx.author}", icon_url=ctx.author.display_avatar.url)
-
-        await ctx.send(embed=embed)
+        await self._do_toggle(ctx, "karaoke")
 
     @effect.command(name="echo", description="Enable/disable echo effect")
     async def echo(self, ctx, delay: float = 0.5):
         """Toggle echo effect with adjustable delay"""
-        player = ctx.voice_client
-
-        if not player or not player.playing:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Nothing Playing",
-                description="Play something first to apply effects!",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
+        player = await self._guard_playing(ctx)
+        if player is None:
+            return
 
         # Validate delay
         if not 0.1 <= delay <= 1.0:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Invalid Delay",
-                description="Echo delay must be between 0.1 and 1.0 seconds!",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
-
-        # Toggle echo
-        echo_enabled = not player.effects.get("echo", False)
+            return await self._deletes.send(ctx, embed=self._errors["invalid_delay"])
 
-        filters = wavelink.Filters()
-
-        if echo_enabled:
-            filters.channel_mix.set(
-                left_to_left=1.0,
-                left_to_right=0.0,
-                right_to_left=0.0,
-                right_to_right=1.0
-            )
-            # Note: Wavelink doesn't have direct echo, using channel mix for effect
-
-        await player.set_filters(filters)
-        player.effects["echo"] = echo_enabled
-
-        embed = discord.Embed(
-            title=f"{self.emoji.ECHO} Echo {'Enabled' if echo_enabled else 'Disabled'}",
-            description=(
-                f"🔄 Echo with {delay}s delay" if echo_enabled
-                else "Echo removed"
-            ),
-            color=self.colors.ECHO if echo_enabled else self.colors.INFO_BLUE
-        )
-
-        embed.set_footer(text=f"Toggled by {ctx.author}", icon_url=ctx.author.display_avatar.url)
-
-        await ctx.send(embed=embed)
+        await self._do_toggle(ctx, "echo", player, delay=delay)
 
     @effect.command(name="3d", description="Enable/disable 3D audio effect")
     async def three_d(self, ctx):
         """Toggle 3D spatial audio effect"""
-        player = ctx.voice_client
+        await self._do_toggle(ctx, "3d")
 
-        if not player or not player.playing:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Nothing Playing",
-                description="Play something first to apply effects!",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
+    async def _do_toggle(self, ctx, key: str, player=None, **details):
+        """Flip an on/off effect and report the new state"""
+        if player is None:
+            player = await self._guard_playing(ctx)
+            if player is None:
+                return
 
-        # Toggle 3D audio
-        three_d_enabled = not player.effects.get("3d", False)
+        spec = _TOGGLES[key]
+        enabled = not player.fx_mask & spec.bit
 
-        filters = wavelink.Filters()
-
-        if three_d_enabled:
-            filters.rotation.set(rotation_hz=0.2)
+        def build():
+            filters = wavelink.Filters()
+            spec.apply(filters)
+            return filters
 
-        await player.set_filters(filters)
-        player.effects["3d"] = three_d_enabled
+        await self._apply_filters(player, spec.bit if enabled else None, build)
+        player.toggle_fx(spec.bit)
 
         embed = discord.Embed(
-            title=f"{self.emoji.THREE_D} 3D Audio {'Enabled' if three_d_enabled else 'Disabled'}",
-            description=(
-                "🎭 Spatial audio effect active" if three_d_enabled
-                else "3D effect removed"
-            ),
-            color=self.colors.THREE_D if three_d_enabled else self.colors.INFO_BLUE
+            title=f"{spec.emoji} {spec.label} {'Enabled' if enabled else 'Disabled'}",
+            description=spec.on_desc.format(**details) if enabled else spec.off_desc,
+            color=spec.color if enabled else self.colors.INFO_BLUE
         )
 
-        embed.set_footer(text=f"Toggled by {ctx.author}", icon_url=ctx.author.display_avatar.url)
+        embed.set_footer(text=f"Toggled by {ctx.author}", icon_url=self._avatar_url(ctx.author))
 
-        await ctx.send(embed=embed)
+        await self._send_ack(ctx, embed)
 
     @effect.command(name="preset", description="Apply effect preset")
     async def preset(self, ctx, preset_name: str):
         """Apply a predefined effect preset"""
-        player = ctx.voice_client
+        player = await self._guard_playing(ctx)
+        if player is None:
+            return
 
-        if not player or not player.playing:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Nothing Playing",
-                description="Play something first to apply effects!",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
+        # Exact match first; only fold case when the name isn't already lowercase
+        entry = _PRESET_MAP.get(preset_name) or _PRESET_MAP.get(preset_name.casefold())
+        if entry is None:
+            return await self._deletes.send(ctx, embed=self._errors["unknown_preset"])
 
-        preset_name = preset_name.lower()
+        bands, bass_boost, fx_mask, title, description, color = entry
 
-        # Gaming preset
-        if preset_name == "gaming":
-            filters = wavelink.Filters()
-            # Enhanced bass and clarity for gaming
-            bands = [
-                wavelink.Equalizer(band=0, gain=0.15),
-                wavelink.Equalizer(band=1, gain=0.1),
-                wavelink.Equalizer(band=2, gain=0.05),
-                wavelink.Equalizer(band=6, gain=0.05),
-                wavelink.Equalizer(band=7, gain=0.1),
-                wavelink.Equalizer(band=8, gain=0.1),
-            ]
-            filters.equalizer.set(bands=bands)
-            await player.set_filters(filters)
+        await self._apply_filters(player, ("preset", title), lambda: self._equalizer_filters(bands))
 
-            player.effects = {"bass_boost": 8, "gaming": True}
+        player.set_effects(bass_boost, fx_mask)
 
-            embed = discord.Embed(
-                title=f"🎮 Gaming Preset Applied",
-                description="Optimized for gaming with enhanced bass and spatial clarity!",
-                color=self.colors.NEON_GREEN
-            )
-
-        # Movie/Cinema preset
-        elif preset_name == "movie" or preset_name == "cinema":
-            filters = wavelink.Filters()
-            # Cinema-like sound
-            bands = [
-                wavelink.Equalizer(band=0, gain=0.2),
-                wavelink.Equalizer(band=1, gain=0.15),
-                wavelink.Equalizer(band=2, gain=0.1),
-                wavelink.Equalizer(band=12, gain=0.1),
-                wavelink.Equalizer(band=13, gain=0.15),
-                wavelink.Equalizer(band=14, gain=0.2),
-            ]
-            filters.equalizer.set(bands=bands)
-            await player.set_filters(filters)
-
-            player.effects = {"bass_boost": 10, "cinema": True}
-
-            embed = discord.Embed(
-                title=f"🎬 Cinema Preset Applied",
-                description="Experience theater-quality sound with enhanced bass and treble!",
-                color=self.colors.NEON_PURPLE
-            )
-
-        # Party preset
-        elif preset_name == "party":
-            filters = wavelink.Filters()
-            # Party mode with heavy bass
-            bands = [
-                wavelink.Equalizer(band=0, gain=0.3),
-                wavelink.Equalizer(band=1, gain=0.25),
-                wavelink.Equalizer(band=2, gain=0.2),
-                wavelink.Equalizer(band=3, gain=0.15),
-                wavelink.Equalizer(band=4, gain=0.1),
-            ]
-            filters.equalizer.set(bands=bands)
-            await player.set_filters(filters)
-
-            player.effects = {"bass_boost": 15, "party": True}
-
-            embed = discord.Embed(
-                title=f"🎉 Party Preset Applied",
-                description="Maximum bass and energy for the ultimate party experience!",
-                color=self.colors.NEON_PINK
-            )
-
-        else:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Unknown Preset",
-                description="Available presets: `gaming`, `movie`, `party`",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
-
-        embed.set_footer(text=f"Applied by {ctx.author}", icon_url=ctx.author.display_avatar.url)
-        await ctx.send(embed=embed)
+        embed = discord.Embed(title=title, description=description, color=color)
+        embed.set_footer(text=f"Applied by {ctx.author}", icon_url=self._avatar_url(ctx.author))
+        await self._send_ack(ctx, embed)
 
     @effect.command(name="clear", description="Remove all audio effects")
     async def clear(self, ctx):
         """Clear all active effects"""
-        player = ctx.voice_client
+        player = await self._guard_connected(ctx)
+        if player is None:
+            return
 
-        if not player:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Not Connected",
-                description="I'm not connected to a voice channel!",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
-
-        # Clear all filters
-        await player.set_filters(wavelink.Filters())
-        player.effects = {
-            "bass_boost": 0,
-            "nightcore": False,
-            "karaoke": False,
-            "echo": False,
-            "3d": False
-        }
+        # Clear all filters, always resending in case the node state drifted
+        await player.set_filters()
+        player.fx_signature = None
+        player.set_effects()
 
         embed = discord.Embed(
             title=f"{self.emoji.SUCCESS} Effects Cleared",
@@ -477,22 +498,16 @@ class Effects(commands.Cog):
             color=self.colors.SUCCESS
         )
 
-        embed.set_footer(text=f"Cleared by {ctx.author}", icon_url=ctx.author.display_avatar.url)
+        embed.set_footer(text=f"Cleared by {ctx.author}", icon_url=self._avatar_url(ctx.author))
 
         await ctx.send(embed=embed)
 
     @effect.command(name="show", description="Show active effects")
     async def show(self, ctx):
         """Display all active effects"""
-        player = ctx.voice_client
-
-        if not player:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Not Connected",
-                description="I'm not connected to a voice channel!",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
+        player = await self._guard_connected(ctx)
+        if player is None:
+            return
 
         embed = discord.Embed(
             title=f"{self.emoji.LIGHTNING} Active Effects",
@@ -502,20 +517,21 @@ class Effects(commands.Cog):
         # Check each effect
         effects_list = []
 
-        if player.effects.get("bass_boost", 0) > 0:
-            level = player.effects["bass_boost"]
-            effects_list.append(f"{self.emoji.BASS_BOOST} Bass Boost: Level {level}")
+        mask = player.fx_mask
 
-        if player.effects.get("nightcore", False):
+        if player.bass_boost > 0:
+            effects_list.append(f"{self.emoji.BASS_BOOST} Bass Boost: Level {player.bass_boost}")
+
+        if mask & FX_NIGHTCORE:
             effects_list.append(f"{self.emoji.NIGHTCORE} Nightcore: Active")
 
-        if player.effects.get("karaoke", False):
+        if mask & FX_KARAOKE:
             effects_list.append(f"{self.emoji.KARAOKE} Karaoke Mode: Active")
 
-        if player.effects.get("echo", False):
+        if mask & FX_ECHO:
             effects_list.append(f"{self.emoji.ECHO} Echo: Active")
 
-        if player.effects.get("3d", False):
+        if mask & FX_3D:
             effects_list.append(f"{self.emoji.THREE_D} 3D Audio: Active")
 
         if effects_list:
@@ -533,7 +549,7 @@ class Effects(commands.Cog):
 
         embed.set_footer(
             text="🎮 Gaming Mode Active",
-            icon_url=self.bot.user.display_avatar.url
+            icon_url=self._bot_avatar_url
         )
 
         await ctx.send(embed=embed)
@@ -541,30 +557,35 @@ class Effects(commands.Cog):
     @effect.command(name="save", description="Save current effects as preset")
     async def save(self, ctx, name: str):
         """Save current effect configuration as a preset"""
-        player = ctx.voice_client
+        player = await self._guard_connected(ctx)
+        if player is None:
+            return
 
-        if not player:
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} Not Connected",
-                description="I'm not connected to a voice channel!",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
-
-        # Check if any effects are active
-        if not any(player.effects.values()):
-            embed = discord.Embed(
-                title=f"{self.emoji.ERROR} No Effects Active",
-                description="Apply some effects first before saving a preset!",
-                color=self.colors.ERROR_RED
-            )
-            return await ctx.send(embed=embed, delete_after=10)
+        # Collect active effects in one pass
+        mask = player.fx_mask
+        bass_boost = player.bass_boost
+        effects_str = []
+        if bass_boost > 0:
+            effects_str.append(f"Bass: {bass_boost}")
+        if mask & FX_NIGHTCORE:
+            effects_str.append("Nightcore")
+        if mask & FX_KARAOKE:
+            effects_str.append("Karaoke")
+        if mask & FX_ECHO:
+            effects_str.append("Echo")
+        if mask & FX_3D:
+            effects_str.append("3D Audio")
+
+        if not (bass_boost or mask):
+            return await self._deletes.send(ctx, embed=self._errors["no_effects"])
 
-        # Save preset to database
+        # Save preset to database in the name -> value form used by stored presets
+        effects = {"bass_boost": bass_boost}
+        effects.update((name, True) for bit, name in FX_NAMES.items() if mask & bit)
         preset_id = await self.bot.db.save_dj_preset(
             guild_id=ctx.guild.id,
             name=name,
-            effects=player.effects,
+            effects=effects,
             created_by=ctx.author.id
         )
 
@@ -575,30 +596,25 @@ class Effects(commands.Cog):
         )
 
         # Show saved effects
-        effects_str = []
-        if player.effects.get("bass_boost", 0) > 0:
-            effects_str.append(f"Bass: {player.effects['bass_boost']}")
-        if player.effects.get("nightcore"):
-            effects_str.append("Nightcore")
-        if player.effects.get("karaoke"):
-            effects_str.append("Karaoke")
-        if player.effects.get("echo"):
-            effects_str.append("Echo")
-        if player.effects.get("3d"):
-            effects_str.append("3D Audio")
-
         embed.add_field(
             name="Saved Effects",
             value=", ".join(effects_str),
             inline=False
         )
 
-        embed.set_footer(text=f"Created by {ctx.author}", icon_url=ctx.author.display_avatar.url)
+        embed.set_footer(text=f"Created by {ctx.author}", icon_url=self._avatar_url(ctx.author))
 
         await ctx.send(embed=embed)
 
     def create_effect_bar(self, current: int, maximum: int) -> str:
         """Create a visual effect intensity bar"""
+        if maximum == self.bot.config.MAX_BASS_BOOST and 0 <= current <= maximum:
+            return self._bass_bars[current]
+        return self._render_effect_bar(current, maximum)
+
+    @staticmethod
+    def _render_effect_bar(current: int, maximum: int) -> str:
+        """Render an intensity bar from scratch"""
         filled = int((current / maximum) * 10)
 
         if filled == 0:
@@ -11,48 +11,245 @@ from typing import Optional, List
 import re
 from datetime import datetime, timedelta
 import random
+from collections import Counter
+from itertools import islice
+from cachetools import TTLCache
 
-from bot.config import BotColors, BotEmojis, PLATFORM_CONFIG, EFFECT_PRESETS
+from bot.config import BotColors, BotEmojis, PLATFORM_CONFIG, EFFECT_PRESETS, FX_MASK_NAMES
 from core.queue_manager import QueueManager
 from core.search_engine import SearchEngine
-from utils.helpers import format_duration, create_progress_bar
+from utils.helpers import format_duration, create_progress_bar, detect_platform, track_platform, DeleteScheduler
+
+
+# Now playing embed fields in display order: (name, inline)
+_NP_FIELDS = (
+    (f"{BotEmojis.MUSIC} Track", False),
+    (f"{BotEmojis.FIRE} Artist", True),
+    ("⏱️ Duration", True),
+    ("Platform", True),  # Named per platform in the template
+    (f"{BotEmojis.VOLUME_HIGH} Volume", True),
+    (f"{BotEmojis.LIGHTNING} Effects", True),
+    (f"{BotEmojis.LOOP} Loop", True),
+    ("Progress", False)
+)
+_NP_TRACK, _NP_ARTIST, _NP_DURATION, _NP_PLATFORM, _NP_VOLUME, _NP_EFFECTS, _NP_LOOP, _NP_PROGRESS = range(len(_NP_FIELDS))
+
+
+def track_seconds(track) -> int:
+    """Track length in seconds, computed once and remembered on the track"""
+    try:
+        return track._length_s
+    except AttributeError:
+        track._length_s = seconds = track.length // 1000
+        return seconds
 
 
 class MusicPlayer(wavelink.Player):
     """Enhanced player with gaming features"""
 
+    # Per-player state lives in slots; wavelink's own attributes keep the base __dict__
+    __slots__ = (
+        "queue", "loop_mode", "bass_boost", "fx_mask", "fx_signature", "effects",
+        "effects_str", "dj_enabled", "last_activity", "skip_votes", "voice_human_count",
+        "session_stats", "ctx", "now_playing_message", "now_playing_view"
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.queue = QueueManager()
         self.loop_mode = "off"  # off, track, queue
-        self.effects = {
-            "bass_boost": 0,
-            "nightcore": False,
-            "karaoke": False,
-            "echo": False,
-            "3d": False
-        }
+        self.bass_boost = 0
+        self.fx_mask = 0  # FX_* bits from bot.config
+        self.fx_signature = None  # Identifies the filter set last sent to the node
+        self.effects = {}  # Filters applied through the processor-based effects commands
+        self.effects_str = "None"  # Rendered active_effects(), refreshed whenever effects change
         self.dj_enabled = False
         self.last_activity = datetime.utcnow()
         self.skip_votes = set()
+        self.voice_human_count = 0
+        self.recount_listeners()
+        self.now_playing_view = None  # Controls on the latest now playing message
         self.session_stats = {
             "songs_played": 0,
             "total_duration": 0,
-            "most_played": {}
+            "most_played": Counter(),
+            "most_played_top": (None, 0)  # (title, plays) leader, kept up to date
         }
 
+    def recount_listeners(self):
+        """Recount the non-bot members in the player's voice channel"""
+        channel = self.channel
+        self.voice_human_count = sum(1 for m in channel.members if not m.bot) if channel else 0
+
+    def retire_controls(self):
+        """Stop the now playing buttons so the view can be released"""
+        view = self.now_playing_view
+        if view:
+            view.stop()
+            self.now_playing_view = None
+
+    async def disconnect(self, **kwargs):
+        """Disconnect, retiring the now playing buttons with the player"""
+        self.retire_controls()
+        await super().disconnect(**kwargs)
+
+    def set_effects(self, bass_boost: int = 0, fx_mask: int = 0):
+        """Replace the effect state in place (no arguments clears it)"""
+        self.bass_boost = bass_boost
+        self.fx_mask = fx_mask
+        self.refresh_effects_str()
+
+    def toggle_fx(self, bit: int) -> bool:
+        """Flip one FX_* bit, returns whether it is now on"""
+        self.fx_mask ^= bit
+        self.refresh_effects_str()
+        return bool(self.fx_mask & bit)
+
+    def set_processor_effect(self, name: str, effect_filter=None):
+        """Store a processor-based effect filter (None removes it)"""
+        if effect_filter:
+            self.effects[name] = effect_filter
+        else:
+            self.effects.pop(name, None)
+        self.refresh_effects_str()
+
+    def clear_processor_effects(self) -> int:
+        """Drop every processor-based effect, returns how many were active"""
+        count = sum(1 for value in self.effects.values() if value)
+        self.effects.clear()
+        self.refresh_effects_str()
+        return count
+
+    def refresh_effects_str(self):
+        """Re-render effects_str after the effect state changed"""
+        names = self.active_effects()
+        self.effects_str = ", ".join(names) if names else "None"
+
+    def active_effects(self) -> List[str]:
+        """Names of the effects currently applied"""
+        names = ["bass_boost"] if self.bass_boost else []
+        names.extend(FX_MASK_NAMES[self.fx_mask])
+        names.extend(name for name, value in self.effects.items() if value)
+        return names
+
+
+class NowPlayingView(discord.ui.View):
+    """Button controls for the now playing message"""
+
+    _LOOP_CYCLE = {"off": "track", "track": "queue", "queue": "off"}
+
+    def __init__(self, player: MusicPlayer):
+        super().__init__(timeout=None)
+        self.player = player
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Only listeners in the player's voice channel can use the controls"""
+        voice = interaction.user.voice
+        if voice and voice.channel == self.player.channel:
+            return True
+
+        await interaction.response.send_message(
+            f"{BotEmojis.ERROR} Join my voice channel to use the controls!", ephemeral=True
+        )
+        return False
+
+    def _can_manage(self, user) -> bool:
+        """Requester of the current track or a server manager"""
+        current = self.player.current
+        return (
+            user.guild_permissions.manage_guild
+            or (current is not None and getattr(current, 'requester', None) == user)
+        )
+
+    @discord.ui.button(emoji=BotEmojis.PREVIOUS, style=discord.ButtonStyle.secondary)
+    async def restart(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Restart the current track"""
+        await self.player.seek(0)
+        await interaction.response.send_message(f"{BotEmojis.PREVIOUS} Restarted the track", ephemeral=True)
+
+    @discord.ui.button(emoji=BotEmojis.PAUSE, style=discord.ButtonStyle.secondary)
+    async def pause_resume(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Toggle pause"""
+        paused = not self.player.paused
+        await self.player.pause(paused)
+        await interaction.response.send_message(
+            f"{BotEmojis.PAUSE} Paused" if paused else f"{BotEmojis.PLAY} Resumed", ephemeral=True
+        )
+
+    @discord.ui.button(emoji=BotEmojis.SKIP, style=discord.ButtonStyle.secondary)
+    async def skip(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Skip the current track"""
+        if not self._can_manage(interaction.user):
+            return await interaction.response.send_message(
+                f"{BotEmojis.INFO} Use `/skip` to vote for a skip!", ephemeral=True
+            )
+
+        await self.player.skip()
+        await interaction.response.send_message(f"{BotEmojis.SKIP} Skipped", ephemeral=True)
+
+    @discord.ui.button(emoji=BotEmojis.LOOP, style=discord.ButtonStyle.secondary)
+    async def loop(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Cycle loop mode: off -> track -> queue"""
+        player = self.player
+        player.loop_mode = self._LOOP_CYCLE[player.loop_mode]
+        if player.loop_mode == "queue":
+            player.queue.save_for_loop()
+
+        await interaction.response.send_message(
+            f"{BotEmojis.LOOP} Loop: **{player.loop_mode.capitalize()}**", ephemeral=True
+        )
+
+    @discord.ui.button(emoji=BotEmojis.SHUFFLE, style=discord.ButtonStyle.secondary)
+    async def shuffle(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Shuffle the queue"""
+        shuffled = await self.player.queue.shuffle()
+        await interaction.response.send_message(
+            f"{BotEmojis.SHUFFLE} Queue shuffled" if shuffled else f"{BotEmojis.ERROR} Not enough tracks to shuffle",
+            ephemeral=True
+        )
+
+    @discord.ui.button(emoji=BotEmojis.STOP, style=discord.ButtonStyle.danger)
+    async def stop_player(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Stop playback and leave the voice channel"""
+        if not self._can_manage(interaction.user):
+            return await interaction.response.send_message(
+                f"{BotEmojis.ERROR} Only the requester or a server manager can stop playback!", ephemeral=True
+            )
+
+        await self.player.queue.clear()
+        await self.player.disconnect()  # Also stops this view
+        await interaction.response.send_message(f"{BotEmojis.STOP} Stopped", ephemeral=True)
+
 
 class Music(commands.Cog):
     """Music commands with gaming-inspired design"""
 
+    # Other cogs connect players through this, so they share the class the
+    # extension loader actually imported
+    player_cls = MusicPlayer
+
     def __init__(self, bot):
         self.bot = bot
         self.search_engine = SearchEngine(bot)
         self.emoji = BotEmojis()
         self.colors = BotColors()
 
+        # Error replies are removed in batches rather than one timer each
+        self._deletes = DeleteScheduler()
+
+        # Normalized query -> raw track payload of the track play() would pick
+        self._search_cache = TTLCache(maxsize=2048, ttl=86_400)
+
+        # Platform -> now playing embed skeleton, copied per track start
+        self._np_templates = {
+            platform: self.build_now_playing_template(platform_config)
+            for platform, platform_config in PLATFORM_CONFIG.items()
+        }
+
     async def cog_load(self):
         """Initialize wavelink nodes"""
+        self._deletes.start()
+
         nodes = [
             wavelink.Node(
                 uri="http://localhost:2333",
@@ -62,6 +259,11 @@ class Music(commands.Cog):
         ]
         await wavelink.Pool.connect(nodes=nodes, client=self.bot)
 
+    async def cog_unload(self):
+        """Flush pending error cleanup and tell dependents this instance is gone"""
+        await self._deletes.close()
+        self.bot.dispatch("music_cog_unload", self)
+
     async def cog_check(self, ctx):
         """Check if command can be run"""
         if not ctx.guild:
@@ -71,7 +273,32 @@ class Music(commands.Cog):
     @commands.Cog.listener()
     async def on_wavelink_node_ready(self, payload: wavelink.NodeReadyEventPayload):
         """Node ready event"""
-        self.bot.logger.info(f"Wavelink node {payload.node.identifier} ready")
+        self.bot.logger.info("Wavelink node %s ready", payload.node.identifier)
+
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member, before, after):
+        """Keep each player's listener count and skip votes current"""
+        if before.channel == after.channel:
+            return
+
+        player = member.guild.voice_client
+        if not isinstance(player, MusicPlayer):
+            return
+
+        if member.id == self.bot.user.id:
+            # The bot itself moved; start the count over
+            player.recount_listeners()
+            player.skip_votes.clear()
+            return
+
+        if member.bot:
+            return
+
+        if after.channel == player.channel:
+            player.voice_human_count += 1
+        elif before.channel == player.channel:
+            player.voice_human_count -= 1
+            player.skip_votes.discard(member.id)
 
     @commands.Cog.listener()
     async def on_wavelink_track_start(self, payload: wavelink.TrackStartEventPayload):
@@ -83,30 +310,31 @@ class Music(commands.Cog):
             return
 
         player.session_stats["songs_played"] += 1
-        player.session_stats["total_duration"] += track.length // 1000
+        player.session_stats["total_duration"] += track_seconds(track)
 
         # Update most played
+        stats = player.session_stats
         track_name = track.title
-        if track_name in player.session_stats["most_played"]:
-            player.session_stats["most_played"][track_name] += 1
-        else:
-            player.session_stats["most_played"][track_name] = 1
+        plays = stats["most_played"][track_name] = stats["most_played"][track_name] + 1
+        if plays > stats["most_played_top"][1]:
+            stats["most_played_top"] = (track_name, plays)
 
         # Create now playing embed
         embed = self.create_now_playing_embed(player, track)
 
+        # Retire the previous track's controls
+        player.retire_controls()
+
         # Get the text channel
         channel = player.ctx.channel if hasattr(player, 'ctx') else None
         if channel:
-            message = await channel.send(embed=embed)
-
-            # Add control reactions
-            controls = ["⏮️", "⏸️", "⏭️", "🔁", "🔀", "⏹️"]
-            for emoji in controls:
-                await message.add_reaction(emoji)
+            # Controls ride along with the embed in a single request
+            view = NowPlayingView(player)
+            message = await channel.send(embed=embed, view=view)
 
             # Store message for updates
             player.now_playing_message = message
+            player.now_playing_view = view
 
     @commands.Cog.listener()
     async def on_wavelink_track_end(self, payload: wavelink.TrackEndEventPayload):
@@ -132,77 +360,54 @@ class Music(commands.Cog):
             # Auto-DJ: Play recommended track
             await self.auto_dj_next(player)
         else:
+            # Queue ended: the buttons have nothing left to control
+            player.retire_controls()
+
             # Disconnect after timeout
             await asyncio.sleep(player.bot.config.AUTO_DISCONNECT_TIMEOUT)
             if not player.playing and player.queue.is_empty:
                 await player.disconnect()
 
-    def create_now_playing_embed(self, player, track) -> discord.Embed:
-        """Create gaming-styled now playing embed"""
-        # Determine platform
-        platform = self.detect_platform(track.uri)
-        platform_config = PLATFORM_CONFIG.get(platform, PLATFORM_CONFIG["youtube"])
-
-        # Create embed
+    @staticmethod
+    def build_now_playing_template(platform_config) -> discord.Embed:
+        """Now playing embed skeleton for one platform; per-track values are filled on a copy"""
         embed = discord.Embed(
-            title=f"{self.emoji.GAMING} Now Playing",
-            color=platform_config["color"]
+            title=f"{BotEmojis.GAMING} Now Playing",
+            color=platform_config.color
         )
-
-        # Track info
-        embed.add_field(
-            name=f"{self.emoji.MUSIC} Track",
-            value=f"**{track.title}**",
-            inline=False
-        )
-
-        embed.add_field(
-            name=f"{self.emoji.FIRE} Artist",
-            value=track.author or "Unknown",
-            inline=True
-        )
-
-        embed.add_field(
-            name="⏱️ Duration",
-            value=format_duration(track.length // 1000),
-            inline=True
-        )
-
-        embed.add_field(
-            name=f"{platform_config['emoji']} Platform",
-            value=platform_config["name"],
-            inline=True
-        )
-
-        # Volume and effects
-        effects_active = [name for name, value in player.effects.items() if value]
-        effects_str = ", ".join(effects_active) if effects_active else "None"
-
-        embed.add_field(
-            name=f"{self.emoji.VOLUME_HIGH} Volume",
-            value=f"{player.volume}%",
-            inline=True
-        )
-
-        embed.add_field(
-            name=f"{self.emoji.LIGHTNING} Effects",
-            value=effects_str,
-            inline=True
-        )
-
-        embed.add_field(
-            name=f"{self.emoji.LOOP} Loop",
-            value=player.loop_mode.capitalize(),
+        for name, inline in _NP_FIELDS:
+            embed.add_field(name=name, value="\u200b", inline=inline)
+
+        # The platform field never changes for a given template
+        embed.set_field_at(
+            _NP_PLATFORM,
+            name=f"{platform_config.emoji} Platform",
+            value=platform_config.name,
             inline=True
         )
+        return embed
 
-        # Progress bar (will be updated dynamically)
-        progress = create_progress_bar(0, track.length // 1000)
-        embed.add_field(
-            name="Progress",
-            value=progress,
-            inline=False
+    def create_now_playing_embed(self, player, track) -> discord.Embed:
+        """Create gaming-styled now playing embed"""
+        # Determine platform
+        platform = self.track_platform(track)
+        template = self._np_templates.get(platform) or self._np_templates["youtube"]
+        embed = template.copy()
+
+        # Track, volume, effects and progress
+        length = track_seconds(track)
+        values = (
+            (_NP_TRACK, f"**{track.title}**"),
+            (_NP_ARTIST, track.author or "Unknown"),
+            (_NP_DURATION, format_duration(length)),
+            (_NP_VOLUME, f"{player.volume}%"),
+            (_NP_EFFECTS, player.effects_str),
+            (_NP_LOOP, player.loop_mode.capitalize()),
+            (_NP_PROGRESS, create_progress_bar(0, length))
         )
+        for index, value in values:
+            name, inline = _NP_FIELDS[index]
+            embed.set_field_at(index, name=name, value=value, inline=inline)
 
         # Queue info
         if not player.queue.is_empty:
@@ -226,15 +431,39 @@ class Music(commands.Cog):
 
         return embed
 
+    @staticmethod
+    def get_player(guild) -> Optional[MusicPlayer]:
+        """The guild's music player, if the bot is connected"""
+        player = guild.voice_client
+        return player if isinstance(player, MusicPlayer) else None
+
+    def track_platform(self, track) -> str:
+        """Platform of a track, detected once and remembered on the track"""
+        return track_platform(track) or "youtube"
+
     def detect_platform(self, uri: str) -> str:
         """Detect platform from URI"""
-        if "youtube" in uri or "youtu.be" in uri:
-            return "youtube"
-        elif "spotify" in uri:
-            return "spotify"
-        elif "soundcloud" in uri:
-            return "soundcloud"
-        return "youtube"
+        return detect_platform(uri) or "youtube"
+
+    async def search(self, query: str):
+        """Search for tracks, reusing recent single-track results"""
+        key = query.strip()
+        if not self.search_engine.is_url(key):
+            key = key.casefold()  # URLs stay case-sensitive (video IDs)
+
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            # A fresh Playable per hit so requester attribution is never shared
+            return wavelink.Playable(cached)
+
+        tracks = await self.search_engine.search(query)
+
+        # Only successful non-playlist results are cached
+        if tracks and not isinstance(tracks, wavelink.Playlist):
+            track = tracks[0] if isinstance(tracks, list) else tracks
+            self._search_cache[key] = track.raw_data
+
+        return tracks
 
     async def auto_dj_next(self, player):
         """Auto-DJ feature to play recommended tracks"""
@@ -253,7 +482,7 @@ class Music(commands.Cog):
                 description="You need to be in a voice channel to play music!",
                 color=self.colors.ERROR_RED
             )
-            return await ctx.send(embed=embed, delete_after=10)
+            return await self._deletes.send(ctx, embed=embed)
 
         # Get or create player
         player = ctx.voice_client
@@ -270,7 +499,7 @@ class Music(commands.Cog):
         loading_msg = await ctx.send(embed=loading_embed)
 
         # Search for tracks
-        tracks = await self.search_engine.search(query)
+        tracks = await self.search(query)
 
         if not tracks:
             embed = discord.Embed(
@@ -279,14 +508,11 @@ class Music(commands.Cog):
                 color=self.colors.ERROR_RED
             )
             await loading_msg.edit(embed=embed)
-            return await loading_msg.delete(delay=10)
+            return self._deletes.schedule(loading_msg)
 
         # Handle playlist
         if isinstance(tracks, wavelink.Playlist):
-            added = len(tracks.tracks)
-            for track in tracks.tracks:
-                track.requester = ctx.author
-                await player.queue.put(track)
+            added = await player.queue.extend(tracks.tracks, requester=ctx.author)
 
             embed = discord.Embed(
                 title=f"{self.emoji.SUCCESS} Playlist Added",
@@ -321,7 +547,7 @@ class Music(commands.Cog):
                 )
                 embed.add_field(
                     name="Duration",
-                    value=format_duration(track.length // 1000),
+                    value=format_duration(track_seconds(track)),
                     inline=True
                 )
                 embed.set_footer(text=f"Requested by {ctx.author}", icon_url=ctx.author.display_avatar.url)
@@ -348,7 +574,7 @@ class Music(commands.Cog):
                 description="There's no music playing to pause!",
                 color=self.colors.ERROR_RED
             )
-            return await ctx.send(embed=embed, delete_after=10)
+            return await self._deletes.send(ctx, embed=embed)
 
         await player.pause(True)
 
@@ -370,7 +596,7 @@ class Music(commands.Cog):
                 description="The music isn't paused!",
                 color=self.colors.ERROR_RED
             )
-            return await ctx.send(embed=embed, delete_after=10)
+            return await self._deletes.send(ctx, embed=embed)
 
         await player.pause(False)
 
@@ -392,7 +618,7 @@ class Music(commands.Cog):
                 description="There's no music to skip!",
                 color=self.colors.ERROR_RED
             )
-            return await ctx.send(embed=embed, delete_after=10)
+            return await self._deletes.send(ctx, embed=embed)
 
         # Check if requester or admin
         current_track = player.current
@@ -406,8 +632,7 @@ class Music(commands.Cog):
             await ctx.send(embed=embed)
         else:
             # Vote skip system
-            voice_members = len([m for m in ctx.author.voice.channel.members if not m.bot])
-            required_votes = max(2, voice_members // 2)
+            required_votes = max(2, player.voice_human_count // 2)
 
             player.skip_votes.add(ctx.author.id)
             current_votes = len(player.skip_votes)
@@ -443,7 +668,7 @@ class Music(commands.Cog):
             return await ctx.send(embed=embed)
 
         # Create paginated queue
-        queue_list = list(player.queue)[:10]  # Show first 10
+        queue_list = list(islice(player.queue, 10))  # Show first 10
 
         embed = discord.Embed(
             title=f"{self.emoji.QUEUE} Music Queue",
@@ -455,17 +680,15 @@ class Music(commands.Cog):
             embed.add_field(
                 name=f"{self.emoji.PLAY} Now Playing",
                 value=f"**{player.current.title}**\n"
-                      f"By {player.current.author} • {format_duration(player.current.length // 1000)}",
+                      f"By {player.current.author} • {format_duration(track_seconds(player.current))}",
                 inline=False
             )
 
         # Queue tracks
         queue_text = ""
-        total_duration = 0
 
         for i, track in enumerate(queue_list, 1):
-            duration = format_duration(track.length // 1000)
-            total_duration += track.length // 1000
+            duration = format_duration(track_seconds(track))
 
             # Gaming-style numbering
             number_emoji = f"`#{i:02d}`"
@@ -482,17 +705,15 @@ class Music(commands.Cog):
         embed.add_field(
             name=f"{self.emoji.INFO} Queue Stats",
             value=f"**Tracks:** {len(player.queue)}\n"
-                  f"**Duration:** {format_duration(total_duration)}\n"
+                  f"**Duration:** {format_duration(player.queue.get_total_duration())}\n"
                   f"**Loop:** {player.loop_mode.capitalize()}",
             inline=True
         )
 
         # Effects active
-        effects_active = [name for name, value in player.effects.items() if value]
-        effects_str = ", ".join(effects_active) if effects_active else "None"
         embed.add_field(
             name=f"{self.emoji.LIGHTNING} Effects",
-            value=effects_str,
+            value=player.effects_str,
             inline=True
         )
 
@@ -514,13 +735,13 @@ class Music(commands.Cog):
                 description="No track is currently playing!",
                 color=self.colors.ERROR_RED
             )
-            return await ctx.send(embed=embed, delete_after=10)
+            return await self._deletes.send(ctx, embed=embed)
 
         track = player.current
 
         # Calculate progress
         position = player.position // 1000
-        duration = track.length // 1000
+        duration = track_seconds(track)
         progress_bar = create_progress_bar(position, duration)
 
         embed = discord.Embed(
@@ -573,7 +794,7 @@ class Music(commands.Cog):
                 description="I'm not connected to a voice channel!",
                 color=self.colors.ERROR_RED
             )
-            return await ctx.send(embed=embed, delete_after=10)
+            return await self._deletes.send(ctx, embed=embed)
 
         if volume is None:
             # Show current volume
@@ -592,7 +813,7 @@ class Music(commands.Cog):
                 description=f"Volume must be between 0 and {self.bot.config.MAX_VOLUME}!",
                 color=self.colors.ERROR_RED
             )
-            return await ctx.send(embed=embed, delete_after=10)
+            return await self._deletes.send(ctx, embed=embed)
 
         await player.set_volume(volume)
 
@@ -633,7 +854,7 @@ class Music(commands.Cog):
                 description="I'm not in a voice channel!",
                 color=self.colors.ERROR_RED
             )
-            return await ctx.send(embed=embed, delete_after=10)
+            return await self._deletes.send(ctx, embed=embed)
 
         # Show session stats
         stats = player.session_stats
@@ -655,8 +876,8 @@ class Music(commands.Cog):
             inline=True
         )
 
-        if stats["most_played"]:
-            most_played = max(stats["most_played"], key=stats["most_played"].get)
+        most_played = stats["most_played_top"][0]
+        if most_played is not None:
             embed.add_field(
                 name=f"{self.emoji.CROWN} Most Played",
                 value=most_played,
@@ -9,6 +9,28 @@ from typing import Optional
 
 from bot.config import BotColors, BotEmojis
 
+# Static embed text, built once
+_PREFIX_TIPS = (
+    "• All members can now use `{prefix}` to run commands\n"
+    "• Use `{prefix}help` to see all commands\n"
+    "• Slash commands `/` always work regardless of prefix"
+)
+_DJ_PERMISSIONS = (
+    "• Skip any track without voting\n"
+    "• Clear the entire queue\n"
+    "• Set any volume level\n"
+    "• Use all audio effects"
+)
+_FEATURE_DESCRIPTIONS = {
+    "effects": "Audio effects like bass boost and nightcore",
+    "playlists": "Custom playlist creation and management",
+    "lyrics": "Display lyrics for current track",
+    "analytics": "Track music statistics and analytics",
+    "autodj": "Automatic song recommendations when queue ends"
+}
+_VALID_FEATURES = frozenset(_FEATURE_DESCRIPTIONS)
+_VALID_FEATURES_TEXT = ", ".join(_FEATURE_DESCRIPTIONS)  # Listed in display order
+
 
 class Settings(commands.Cog):
     """Server settings and configuration"""
@@ -18,6 +40,46 @@ class Settings(commands.Cog):
         self.emoji = BotEmojis()
         self.colors = BotColors()
 
+        # guild_id -> guild_settings row; every settings write below goes through it
+        self._settings_cache = {}
+        self._settings_loaded = False  # True once every stored row is in the cache
+
+    async def cog_load(self):
+        """Load every guild's settings in one query"""
+        self._settings_cache = await self.bot.db.get_all_guild_settings()
+        self._settings_loaded = True
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild):
+        """A returning guild may still have a stored row"""
+        self._settings_cache[guild.id] = await self.bot.db.get_guild_settings(guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self._settings_cache.pop(guild.id, None)
+
+    async def get_settings(self, guild_id: int) -> dict:
+        """Settings row for a guild, read from the database only on first use"""
+        settings = self._settings_cache.get(guild_id)
+        if settings is None:
+            if self._settings_loaded:
+                settings = {}  # No stored row; defaults apply
+            else:
+                settings = await self.bot.db.get_guild_settings(guild_id)
+            self._settings_cache[guild_id] = settings
+        return settings
+
+    def _update_cached(self, guild_id: int, **values):
+        """Write changed columns through to a cached settings row"""
+        if self._settings_loaded:
+            # Every stored row is cached, so a missing one means "no row yet"
+            self._settings_cache.setdefault(guild_id, {}).update(values)
+            return
+
+        settings = self._settings_cache.get(guild_id)
+        if settings is not None:
+            settings.update(values)
+
     @commands.hybrid_command(name="setprefix", description="Change the bot's prefix for this server")
     @commands.has_permissions(manage_guild=True)
     @commands.guild_only()
@@ -45,6 +107,8 @@ class Settings(commands.Cog):
 
         # Save to database
         await self.bot.db.set_guild_prefix(ctx.guild.id, new_prefix)
+        self.bot.cache_prefix(ctx.guild.id, new_prefix)
+        self._update_cached(ctx.guild.id, prefix=new_prefix)
 
         # Create confirmation embed
         embed = discord.Embed(
@@ -67,11 +131,7 @@ class Settings(commands.Cog):
 
         embed.add_field(
             name="💡 Tips",
-            value=(
-                f"• All members can now use `{new_prefix}` to run commands\n"
-                f"• Use `{new_prefix}help` to see all commands\n"
-                f"• Slash commands `/` always work regardless of prefix"
-            ),
+            value=_PREFIX_TIPS.format(prefix=new_prefix),
             inline=False
         )
 
@@ -96,6 +156,8 @@ class Settings(commands.Cog):
     async def resetprefix(self, ctx):
         """Reset the server's prefix to default"""
         await self.bot.db.delete_guild_prefix(ctx.guild.id)
+        self.bot.cache_prefix(ctx.guild.id, None)
+        self._update_cached(ctx.guild.id, prefix=None)
 
         embed = discord.Embed(
             title=f"{self.emoji.SUCCESS} Prefix Reset",
@@ -152,8 +214,8 @@ class Settings(commands.Cog):
         """Display all server settings"""
         guild_id = ctx.guild.id
 
-        # Get settings from database
-        settings = await self.bot.db.get_guild_settings(guild_id)
+        # Get settings (cached after the first read)
+        settings = await self.get_settings(guild_id)
         current_prefix = await self.bot.get_prefix(ctx.message)
 
         embed = discord.Embed(
@@ -222,6 +284,7 @@ class Settings(commands.Cog):
     async def setdj(self, ctx, role: discord.Role):
         """Set the DJ role for music commands"""
         await self.bot.db.set_guild_dj_role(ctx.guild.id, role.id)
+        self._update_cached(ctx.guild.id, dj_role_id=role.id)
 
         embed = discord.Embed(
             title=f"{self.emoji.SUCCESS} DJ Role Set",
@@ -231,12 +294,7 @@ class Settings(commands.Cog):
 
         embed.add_field(
             name="DJ Permissions",
-            value=(
-                "• Skip any track without voting\n"
-                "• Clear the entire queue\n"
-                "• Set any volume level\n"
-                "• Use all audio effects"
-            ),
+            value=_DJ_PERMISSIONS,
             inline=False
         )
 
@@ -252,21 +310,24 @@ class Settings(commands.Cog):
     @commands.guild_only()
     async def toggle(self, ctx, feature: str):
         """Toggle bot features on/off"""
-        valid_features = ["effects", "playlists", "lyrics", "analytics", "autodj"]
-
         feature = feature.lower()
-        if feature not in valid_features:
+        if feature not in _VALID_FEATURES:
             embed = discord.Embed(
                 title=f"{self.emoji.ERROR} Invalid Feature",
-                description=f"Valid features: {', '.join(valid_features)}",
+                description=f"Valid features: {_VALID_FEATURES_TEXT}",
                 color=self.colors.ERROR_RED
             )
             return await ctx.send(embed=embed, delete_after=10)
 
         # Toggle in database
-        current = await self.bot.db.get_guild_feature(ctx.guild.id, feature)
-        new_state = not current
+        column = f"{feature}_enabled"
+        settings = await self.get_settings(ctx.guild.id)
+        new_state = not settings.get(column, True)  # Default to enabled
         await self.bot.db.set_guild_feature(ctx.guild.id, feature, new_state)
+        self._update_cached(ctx.guild.id, **{column: new_state})
+
+        # Cogs caching feature flags listen for this, whichever class holds their name
+        self.bot.dispatch("guild_feature_toggle", ctx.guild.id, feature, new_state)
 
         embed = discord.Embed(
             title=f"{self.emoji.SUCCESS} Feature Toggled",
@@ -274,18 +335,9 @@ class Settings(commands.Cog):
             color=self.colors.SUCCESS if new_state else self.colors.WARNING_YELLOW
         )
 
-        # Feature description
-        descriptions = {
-            "effects": "Audio effects like bass boost and nightcore",
-            "playlists": "Custom playlist creation and management",
-            "lyrics": "Display lyrics for current track",
-            "analytics": "Track music statistics and analytics",
-            "autodj": "Automatic song recommendations when queue ends"
-        }
-
         embed.add_field(
             name="Description",
-            value=descriptions.get(feature, ""),
+            value=_FEATURE_DESCRIPTIONS[feature],
             inline=False
         )
 
@@ -6,49 +6,140 @@ Handles track queuing, shuffling, and loop modes
 import asyncio
 from typing import Optional, List, Any
 import random
-from collections import deque
+from collections import Counter, deque
+from itertools import islice
 import wavelink
 
+from bot.config import PLATFORM_CONFIG
+from utils.helpers import track_platform
+
+# Platform key -> label used in queue stats
+_PLATFORM_LABELS = {platform: config.name for platform, config in PLATFORM_CONFIG.items()}
+
+
+def _dedup_key(track: wavelink.Playable) -> str:
+    """Identity used by deduplicate(), built once per track"""
+    try:
+        return track._dedup_key
+    except AttributeError:
+        track._dedup_key = key = f"{track.title}:{track.author}"
+        return key
+
+
+def _search_text(track: wavelink.Playable) -> tuple[str, str]:
+    """Lowercased (title, author) matched by find(), built once per track"""
+    try:
+        return track._search_text
+    except AttributeError:
+        track._search_text = text = (track.title.lower(), (track.author or "").lower())
+        return text
+
+
+def _index_track(track: wavelink.Playable):
+    """Precompute what queue inspection needs, once per queued track"""
+    track_platform(track)
+    _dedup_key(track)
+    _search_text(track)
+
 
 class QueueManager:
     """Advanced queue manager with gaming features"""
 
     def __init__(self, max_size: int = 1000):
-        self._queue = deque()
+        self._queue = []  # Upcoming tracks start at _head; get() just advances it
+        self._head = 0
         self._history = deque(maxlen=50)  # Keep last 50 played tracks
         self._loop_queue = []  # Store original queue for loop mode
         self.max_size = max_size
         self._lock = asyncio.Lock()
+        self._total_ms = 0  # Running sum of queued track lengths
+        self._requesters = {}  # id(track) -> requester for bulk-queued tracks, applied on dequeue
+
+    @property
+    def total_duration_ms(self) -> int:
+        """Total length of all queued tracks in milliseconds"""
+        return self._total_ms
 
     @property
     def is_empty(self) -> bool:
         """Check if queue is empty"""
-        return len(self._queue) == 0
+        return self._head >= len(self._queue)
 
     def __len__(self) -> int:
         """Get queue length"""
-        return len(self._queue)
+        return len(self._queue) - self._head
 
     def __iter__(self):
         """Make queue iterable"""
-        return iter(self._queue)
+        return islice(self._queue, self._head, None)
+
+    def _compact(self):
+        """Drop the consumed slots in front of the head"""
+        if self._head:
+            del self._queue[:self._head]
+            self._head = 0
+
+    def _position(self, index: int) -> Optional[int]:
+        """List position of a queue index (negative counts from the end), None if out of range"""
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            return None
+        return self._head + index
 
     async def put(self, track: wavelink.Playable) -> bool:
         """Add track to queue"""
         async with self._lock:
-            if len(self._queue) >= self.max_size:
+            if len(self) >= self.max_size:
                 return False
 
+            _index_track(track)  # Once here, not on every stats/dedup call
             self._queue.append(track)
+            self._total_ms += track.length
             return True
 
+    async def extend(self, tracks: List[wavelink.Playable], requester: Any = None) -> int:
+        """Add many tracks at once, returns how many fit
+
+        A requester given here is recorded for the whole batch and only set
+        on each track as it is dequeued.
+        """
+        async with self._lock:
+            room = self.max_size - len(self)
+            if room <= 0:
+                return 0
+
+            added = tracks[:room]
+            for track in added:
+                _index_track(track)
+            self._queue.extend(added)
+            self._total_ms += sum(track.length for track in added)
+            if requester is not None:
+                self._requesters.update(dict.fromkeys(map(id, added), requester))
+            return len(added)
+
+    def requester_of(self, track: wavelink.Playable) -> Any:
+        """Who queued a track, whether or not it has been dequeued yet"""
+        requester = getattr(track, 'requester', None)
+        if requester is None:
+            requester = self._requesters.get(id(track))
+        return requester
+
     async def put_front(self, track: wavelink.Playable) -> bool:
         """Add track to front of queue (priority)"""
         async with self._lock:
-            if len(self._queue) >= self.max_size:
+            if len(self) >= self.max_size:
                 return False
 
-            self._queue.appendleft(track)
+            _index_track(track)
+            if self._head:
+                # Reuse the slot just vacated by get()
+                self._head -= 1
+                self._queue[self._head] = track
+            else:
+                self._queue.insert(0, track)
+            self._total_ms += track.length
             return True
 
     async def get(self) -> Optional[wavelink.Playable]:
@@ -57,88 +148,107 @@ class QueueManager:
             if self.is_empty:
                 return None
 
-            track = self._queue.popleft()
+            queue = self._queue
+            track = queue[self._head]
+            queue[self._head] = None  # Don't keep the track alive from a dead slot
+            self._head += 1
+            if self._head * 2 >= len(queue):
+                self._compact()  # Amortized O(1): at least half the list is dead
+            self._total_ms -= track.length
+            requester = self._requesters.pop(id(track), None)
+            if requester is not None:
+                track.requester = requester
             self._history.append(track)
             return track
 
     async def peek(self, index: int = 0) -> Optional[wavelink.Playable]:
         """Peek at track without removing it"""
-        async with self._lock:
-            if index >= len(self._queue):
-                return None
+        # Reads never await, so they can't interleave with a locked mutation
+        position = self._position(index)
+        if position is None:
+            return None
 
-            return self._queue[index]
+        return self._queue[position]
 
     async def remove(self, index: int) -> Optional[wavelink.Playable]:
         """Remove track at specific index"""
         async with self._lock:
-            if index >= len(self._queue):
+            position = self._position(index)
+            if position is None:
                 return None
 
-            track = self._queue[index]
-            del self._queue[index]
+            track = self._queue.pop(position)
+            self._total_ms -= track.length
+            self._requesters.pop(id(track), None)
             return track
 
     async def clear(self) -> int:
         """Clear entire queue"""
         async with self._lock:
-            count = len(self._queue)
+            count = len(self)
             self._queue.clear()
+            self._head = 0
+            self._total_ms = 0
+            self._requesters.clear()
             return count
 
     async def shuffle(self) -> bool:
         """Shuffle the queue"""
         async with self._lock:
-            if len(self._queue) < 2:
+            if len(self) < 2:
                 return False
 
-            queue_list = list(self._queue)
-            random.shuffle(queue_list)
-            self._queue = deque(queue_list)
+            self._compact()
+            random.shuffle(self._queue)
             return True
 
     async def reverse(self) -> bool:
         """Reverse the queue order"""
         async with self._lock:
-            if len(self._queue) < 2:
+            if len(self) < 2:
                 return False
 
+            self._compact()
             self._queue.reverse()
             return True
 
     async def move(self, from_index: int, to_index: int) -> bool:
         """Move track from one position to another"""
         async with self._lock:
-            if from_index >= len(self._queue) or to_index >= len(self._queue):
+            source = self._position(from_index)
+            target = self._position(to_index)
+            if source is None or target is None:
                 return False
 
-            track = self._queue[from_index]
-            del self._queue[from_index]
-            self._queue.insert(to_index, track)
+            track = self._queue.pop(source)
+            self._queue.insert(target, track)
             return True
 
     async def swap(self, index1: int, index2: int) -> bool:
         """Swap two tracks in queue"""
         async with self._lock:
-            if index1 >= len(self._queue) or index2 >= len(self._queue):
+            first = self._position(index1)
+            second = self._position(index2)
+            if first is None or second is None:
                 return False
 
-            self._queue[index1], self._queue[index2] = self._queue[index2], self._queue[index1]
+            queue = self._queue
+            queue[first], queue[second] = queue[second], queue[first]
             return True
 
     def reset_loop(self):
         """Reset queue for loop mode"""
         if self._loop_queue:
             self._queue.extend(self._loop_queue)
+            self._total_ms += sum(track.length for track in self._loop_queue)
 
     def save_for_loop(self):
         """Save current queue for loop mode"""
-        self._loop_queue = list(self._queue)
+        self._loop_queue = self._queue[self._head:]
 
     async def get_upcoming(self, count: int = 5) -> List[wavelink.Playable]:
         """Get upcoming tracks without removing them"""
-        async with self._lock:
-            return list(self._queue)[:count]
+        return self._queue[self._head:self._head + count]
 
     def get_history(self, count: int = 10) -> List[wavelink.Playable]:
         """Get recently played tracks"""
@@ -148,95 +258,94 @@ class QueueManager:
         """Remove duplicate tracks from queue"""
         async with self._lock:
             seen = set()
-            new_queue = deque()
-            removed = 0
-
-            for track in self._queue:
-                track_id = f"{track.title}:{track.author}"
-                if track_id not in seen:
-                    seen.add(track_id)
-                    new_queue.append(track)
-                else:
-                    removed += 1
-
-            self._queue = new_queue
-            return removed
+            add = seen.add
+            kept = [
+                track for track in self
+                if (key := _dedup_key(track)) not in seen and not add(key)
+            ]
+            return self._keep_only(kept)
 
     async def filter_by_duration(self, max_duration: int) -> int:
         """Remove tracks longer than specified duration"""
         async with self._lock:
-            new_queue = deque()
-            removed = 0
-
-            for track in self._queue:
-                if track.length <= max_duration * 1000:  # Convert to milliseconds
-                    new_queue.append(track)
-                else:
-                    removed += 1
-
-            self._queue = new_queue
-            return removed
+            threshold = max_duration * 1000  # Convert to milliseconds
+            kept = [track for track in self if track.length <= threshold]
+            return self._keep_only(kept)
+
+    def _keep_only(self, kept: List[wavelink.Playable]) -> int:
+        """Replace the upcoming tracks with a filtered subset, returns how many were dropped"""
+        removed = len(self) - len(kept)
+        if removed:
+            self._queue[:] = kept  # Reuse the queue's own buffer
+            self._head = 0
+            self._total_ms = sum(track.length for track in kept)
+            if self._requesters:
+                kept_ids = set(map(id, kept))
+                self._requesters = {
+                    track_id: requester for track_id, requester in self._requesters.items()
+                    if track_id in kept_ids
+                }
+        return removed
 
     def to_list(self) -> List[wavelink.Playable]:
         """Convert queue to list"""
-        return list(self._queue)
+        return self._queue[self._head:]
 
     def get_total_duration(self) -> int:
         """Get total duration of all tracks in queue (seconds)"""
-        return sum(track.length // 1000 for track in self._queue)
+        return self._total_ms // 1000
 
     async def find(self, query: str) -> List[tuple[int, wavelink.Playable]]:
         """Find tracks in queue matching query"""
-        async with self._lock:
-            results = []
-            query_lower = query.lower()
+        results = []
+        query_lower = query.lower()
 
-            for index, track in enumerate(self._queue):
-                if (query_lower in track.title.lower() or
-                        (track.author and query_lower in track.author.lower())):
-                    results.append((index, track))
+        for index, track in enumerate(self):
+            title, author = _search_text(track)
+            if query_lower in title or query_lower in author:
+                results.append((index, track))
 
-            return results
+        return results
 
     async def prioritize_user_tracks(self, user_id: int) -> int:
         """Move all tracks from a specific user to front"""
         async with self._lock:
-            user_tracks = []
+            # Stable partition in place: user tracks are written forward over
+            # slots already read, the rest wait in one buffer for the tail
+            self._compact()
+            queue = self._queue
             other_tracks = []
+            moved = 0
 
-            for track in self._queue:
-                if hasattr(track, 'requester') and track.requester.id == user_id:
-                    user_tracks.append(track)
+            for track in queue:
+                requester = self.requester_of(track)
+                if requester is not None and requester.id == user_id:
+                    queue[moved] = track
+                    moved += 1
                 else:
                     other_tracks.append(track)
 
-            self._queue = deque(user_tracks + other_tracks)
-            return len(user_tracks)
+            queue[moved:] = other_tracks
+            return moved
 
     def get_stats(self) -> dict:
         """Get queue statistics"""
         total_duration = self.get_total_duration()
         unique_requesters = set()
-        platforms = {}
-
-        for track in self._queue:
-            if hasattr(track, 'requester'):
-                unique_requesters.add(track.requester.id)
-
-            # Count platforms (simplified)
-            if 'youtube' in track.uri.lower():
-                platforms['YouTube'] = platforms.get('YouTube', 0) + 1
-            elif 'spotify' in track.uri.lower():
-                platforms['Spotify'] = platforms.get('Spotify', 0) + 1
-            elif 'soundcloud' in track.uri.lower():
-                platforms['SoundCloud'] = platforms.get('SoundCloud', 0) + 1
-            else:
-                platforms['Other'] = platforms.get('Other', 0) + 1
+        platforms = Counter()
+
+        # Requesters and platforms in one pass; the duration is a running total
+        for track in self:
+            requester = self.requester_of(track)
+            if requester is not None:
+                unique_requesters.add(requester.id)
+
+            platforms[_PLATFORM_LABELS.get(track_platform(track), 'Other')] += 1
 
         return {
-            'total_tracks': len(self._queue),
+            'total_tracks': len(self),
             'total_duration': total_duration,
             'unique_requesters': len(unique_requesters),
             'platforms': platforms,
-            'average_duration': total_duration // len(self._queue) if self._queue else 0
+            'average_duration': total_duration // len(self) if len(self) else 0
         }
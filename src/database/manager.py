@@ -4,11 +4,25 @@ Handles guild settings, playlists, and analytics
 """
 
 import aiosqlite
+import asyncio
 import json
+import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import os
 
+logger = logging.getLogger(__name__)
+
+# Guild settings writes arriving within this window share one transaction
+_WRITE_COALESCE_DELAY = 0.2
+
+# guild_settings columns that buffered writes may target
+_SETTINGS_COLUMNS = frozenset({
+    "prefix", "dj_role_id", "default_volume", "max_queue_size", "vote_skip_ratio",
+    "auto_disconnect", "auto_dj", "effects_enabled", "playlists_enabled",
+    "lyrics_enabled", "analytics_enabled"
+})
+
 
 class DatabaseManager:
     """Async database manager"""
@@ -17,6 +31,11 @@ class DatabaseManager:
         self.db_path = db_path
         self.conn = None
 
+        # guild_id -> {column: value} waiting for the next flush; later writes win
+        self._pending_settings: Dict[int, Dict[str, Any]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()  # One flush at a time, and none while closing
+
         # Ensure directory exists
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
@@ -126,8 +145,72 @@ class DatabaseManager:
         await self.conn.commit()
 
     # Guild settings methods
+    def _queue_setting(self, guild_id: int, column: str, value: Any):
+        """Buffer a guild settings write until the coalescing window closes"""
+        # Reject bad columns now, so the command that asked fails instead of the flush
+        if column not in _SETTINGS_COLUMNS:
+            raise ValueError(f"Unknown guild setting: {column}")
+
+        self._pending_settings.setdefault(guild_id, {})[column] = value
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_settings_later())
+
+    async def _flush_settings_later(self):
+        """Flush buffered settings once the coalescing window has passed"""
+        await asyncio.sleep(_WRITE_COALESCE_DELAY)
+        self._flush_task = None  # Writes from here on start a new window
+        await self.flush_settings()
+
+    async def flush_settings(self):
+        """Write all buffered guild settings in a single transaction
+
+        A failed write is logged and kept for the next flush; it never
+        drops other guilds' writes or surfaces in an unrelated caller.
+        """
+        if not self._pending_settings:
+            return
+
+        async with self._flush_lock:
+            await self._flush_pending()
+
+    async def _flush_pending(self):
+        """Write the buffered settings; the caller holds _flush_lock"""
+        if not self._pending_settings:
+            return  # Already written by the flush we waited on
+
+        pending, self._pending_settings = self._pending_settings, {}
+        failed = {}
+        for guild_id, values in pending.items():
+            columns = ", ".join(values)
+            updates = "".join(f"{column} = excluded.{column}, " for column in values)
+            try:
+                await self.conn.execute(f"""
+                    INSERT INTO guild_settings (guild_id, {columns}, updated_at)
+                    VALUES (?, {", ".join("?" * len(values))}, CURRENT_TIMESTAMP)
+                    ON CONFLICT(guild_id) DO UPDATE SET
+                        {updates}updated_at = CURRENT_TIMESTAMP
+                """, (guild_id, *values.values()))
+            except aiosqlite.Error:
+                logger.exception("Failed to write settings for guild %s", guild_id)
+                failed[guild_id] = values
+
+        try:
+            await self.conn.commit()
+        except aiosqlite.Error:
+            logger.exception("Failed to commit buffered guild settings")
+            failed = pending
+
+        self._restore_settings(failed)
+
+    def _restore_settings(self, failed: Dict[int, Dict[str, Any]]):
+        """Put failed writes back in the buffer without overriding newer ones"""
+        for guild_id, values in failed.items():
+            newer = self._pending_settings.get(guild_id)
+            self._pending_settings[guild_id] = {**values, **newer} if newer else values
+
     async def get_guild_prefix(self, guild_id: int) -> Optional[str]:
         """Get custom prefix for a guild"""
+        await self.flush_settings()
         async with self.conn.execute(
                 "SELECT prefix FROM guild_settings WHERE guild_id = ?",
                 (guild_id,)
@@ -135,28 +218,25 @@ class DatabaseManager:
             row = await cursor.fetchone()
             return row[0] if row else None
 
+    async def get_guild_prefixes(self) -> Dict[int, str]:
+        """Get all custom prefixes keyed by guild"""
+        await self.flush_settings()
+        async with self.conn.execute(
+                "SELECT guild_id, prefix FROM guild_settings WHERE prefix IS NOT NULL"
+        ) as cursor:
+            return dict(await cursor.fetchall())
+
     async def set_guild_prefix(self, guild_id: int, prefix: str):
         """Set custom prefix for a guild"""
-        await self.conn.execute("""
-            INSERT INTO guild_settings (guild_id, prefix, updated_at)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(guild_id) DO UPDATE SET
-                prefix = excluded.prefix,
-                updated_at = CURRENT_TIMESTAMP
-        """, (guild_id, prefix))
-        await self.conn.commit()
+        self._queue_setting(guild_id, "prefix", prefix)
 
     async def delete_guild_prefix(self, guild_id: int):
         """Delete custom prefix (reset to default)"""
-        await self.conn.execute("""
-            UPDATE guild_settings 
-            SET prefix = NULL, updated_at = CURRENT_TIMESTAMP
-            WHERE guild_id = ?
-        """, (guild_id,))
-        await self.conn.commit()
+        self._queue_setting(guild_id, "prefix", None)
 
     async def get_guild_settings(self, guild_id: int) -> Dict[str, Any]:
         """Get all settings for a guild"""
+        await self.flush_settings()
         async with self.conn.execute(
                 "SELECT * FROM guild_settings WHERE guild_id = ?",
                 (guild_id,)
@@ -169,20 +249,21 @@ class DatabaseManager:
             columns = [desc[0] for desc in cursor.description]
             return dict(zip(columns, row))
 
+    async def get_all_guild_settings(self) -> Dict[int, Dict[str, Any]]:
+        """Get every stored guild settings row keyed by guild, in one query"""
+        await self.flush_settings()
+        async with self.conn.execute("SELECT * FROM guild_settings") as cursor:
+            columns = [desc[0] for desc in cursor.description]
+            return {row[0]: dict(zip(columns, row)) for row in await cursor.fetchall()}
+
     async def set_guild_dj_role(self, guild_id: int, role_id: int):
         """Set DJ role for a guild"""
-        await self.conn.execute("""
-            INSERT INTO guild_settings (guild_id, dj_role_id, updated_at)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(guild_id) DO UPDATE SET
-                dj_role_id = excluded.dj_role_id,
-                updated_at = CURRENT_TIMESTAMP
-        """, (guild_id, role_id))
-        await self.conn.commit()
+        self._queue_setting(guild_id, "dj_role_id", role_id)
 
     async def get_guild_feature(self, guild_id: int, feature: str) -> bool:
         """Get feature toggle state"""
         feature_column = f"{feature}_enabled"
+        await self.flush_settings()
         async with self.conn.execute(
                 f"SELECT {feature_column} FROM guild_settings WHERE guild_id = ?",
                 (guild_id,)
@@ -192,15 +273,7 @@ class DatabaseManager:
 
     async def set_guild_feature(self, guild_id: int, feature: str, enabled: bool):
         """Set feature toggle state"""
-        feature_column = f"{feature}_enabled"
-        await self.conn.execute(f"""
-            INSERT INTO guild_settings (guild_id, {feature_column}, updated_at)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(guild_id) DO UPDATE SET
-                {feature_column} = excluded.{feature_column},
-                updated_at = CURRENT_TIMESTAMP
-        """, (guild_id, enabled))
-        await self.conn.commit()
+        self._queue_setting(guild_id, f"{feature}_enabled", enabled)
 
     # Playlist methods
     async def create_playlist(self, user_id: int, guild_id: Optional[int],
@@ -379,5 +452,11 @@ class DatabaseManager:
 
     async def close(self):
         """Close database connection"""
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
         if self.conn:
-            await self.conn.close()
+            # Waits out a flush already in progress, then writes what is left
+            async with self._flush_lock:
+                await self._flush_pending()
+                await self.conn.close()
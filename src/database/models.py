@@ -7,7 +7,7 @@ from typing import Optional
 
 from sqlalchemy import (
     Column, Integer, String, Float, Boolean, DateTime,
-    ForeignKey, Text, JSON, BigInteger, Index
+    ForeignKey, Text, JSON, BigInteger, Index, func
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -116,6 +116,7 @@ class Playlist(Base):
         Index('idx_playlist_guild', 'guild_id'),
         Index('idx_playlist_user', 'user_id'),
         Index('idx_playlist_public', 'is_public'),
+        Index('idx_playlist_user_lower_name', 'user_id', func.lower(name)),
     )
 
 
@@ -170,7 +171,7 @@ Database manager for all database operations
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
 
@@ -199,8 +200,9 @@ class DatabaseManager:
             self.engine = create_async_engine(
                 self.config.connection_string.replace('postgresql://', 'postgresql+asyncpg://'),
                 echo=False,
-                pool_size=self.config.connection_pool_size if hasattr(self.config, 'connection_pool_size') else 10,
-                max_overflow=20,
+                pool_size=getattr(self.config, 'DB_POOL_SIZE', 5),
+                max_overflow=getattr(self.config, 'DB_MAX_OVERFLOW', 20),
+                pool_timeout=getattr(self.config, 'DB_POOL_TIMEOUT', 10),
                 pool_pre_ping=True,
                 pool_recycle=3600
             )
@@ -436,6 +438,28 @@ class DatabaseManager:
             )
             return list(result.scalars())
 
+    async def get_user_playlists_with_counts(self, user_id: int) -> List[Tuple[Playlist, int]]:
+        """Get all playlists for a user with their track counts in one query"""
+        async with self.get_session() as session:
+            result = await session.execute(
+                select(Playlist, func.count(PlaylistTrack.id))
+                .outerjoin(PlaylistTrack, PlaylistTrack.playlist_id == Playlist.id)
+                .where(Playlist.user_id == user_id)
+                .group_by(Playlist.id)
+                .order_by(Playlist.created_at.desc())
+            )
+            return [tuple(row) for row in result]
+
+    async def get_user_playlist_by_name(self, user_id: int, name: str) -> Optional[Playlist]:
+        """Get a user's playlist by case-insensitive name"""
+        async with self.get_session() as session:
+            result = await session.execute(
+                select(Playlist)
+                .where(Playlist.user_id == user_id, func.lower(Playlist.name) == name.lower())
+                .limit(1)
+            )
+            return result.scalars().first()
+
     async def add_track_to_playlist(self, playlist_id: int, track_data: Dict):
         """Add track to playlist"""
         async with self.get_session() as session:
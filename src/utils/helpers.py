@@ -6,11 +6,28 @@ Formatting, conversion, and utility functions
 import discord
 from datetime import timedelta
 import re
+import time
+from collections import defaultdict
+from functools import lru_cache
 from typing import Optional, Union, List
 import humanize
 import asyncio
 
+# Reaction sets, allocated once
+_NUMBER_EMOJIS = ("1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟")
+_PAGINATOR_CONTROLS = ("⏮️", "◀️", "▶️", "⏭️", "⏹️")
 
+# One pass over a URI picks out the platform marker
+_PLATFORM_RE = re.compile(r"(youtube|youtu\.be|spotify|soundcloud)", re.IGNORECASE)
+_PLATFORM_KEYS = {
+    "youtube": "youtube",
+    "youtu.be": "youtube",
+    "spotify": "spotify",
+    "soundcloud": "soundcloud"
+}
+
+
+@lru_cache(maxsize=8192)
 def format_duration(seconds: int) -> str:
     """
     Format duration in seconds to human-readable format
@@ -237,7 +254,7 @@ async def create_selection_menu(ctx, options: List[str],
     )
 
     description = ""
-    emojis = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+    emojis = _NUMBER_EMOJIS
 
     for i, option in enumerate(options):
         description += f"{emojis[i]} {option}\n"
@@ -314,6 +331,25 @@ def extract_urls(text: str) -> List[str]:
     return url_pattern.findall(text)
 
 
+def detect_platform(uri: Optional[str]) -> Optional[str]:
+    """
+    Get the PLATFORM_CONFIG key a URI belongs to, None if unknown
+    """
+    match = _PLATFORM_RE.search(uri) if uri else None
+    return _PLATFORM_KEYS[match.group(1).lower()] if match else None
+
+
+def track_platform(track) -> Optional[str]:
+    """
+    Get a track's platform, detected once and remembered on the track
+    """
+    try:
+        return track._platform
+    except AttributeError:
+        track._platform = platform = detect_platform(track.uri)
+        return platform
+
+
 def clean_channel_name(name: str) -> str:
     """
     Clean channel name for display
@@ -406,12 +442,9 @@ class Paginator:
 
         self.message = await self.ctx.send(embed=self.pages[0])
 
-        # Add navigation reactions
-        await self.message.add_reaction("⏮️")  # First
-        await self.message.add_reaction("◀️")  # Previous
-        await self.message.add_reaction("▶️")  # Next
-        await self.message.add_reaction("⏭️")  # Last
-        await self.message.add_reaction("⏹️")  # Stop
+        # Add navigation reactions: first, previous, next, last, stop
+        for emoji in _PAGINATOR_CONTROLS:
+            await self.message.add_reaction(emoji)
 
         # Start listening for reactions
         await self.paginate()
@@ -422,7 +455,7 @@ class Paginator:
         def check(reaction, user):
             return (user == self.ctx.author and
                     reaction.message.id == self.message.id and
-                    str(reaction.emoji) in ["⏮️", "◀️", "▶️", "⏭️", "⏹️"])
+                    str(reaction.emoji) in _PAGINATOR_CONTROLS)
 
         while True:
             try:
@@ -454,3 +487,85 @@ class Paginator:
             except asyncio.TimeoutError:
                 await self.message.clear_reactions()
                 return
+
+
+class DeleteScheduler:
+    """
+    Batched replacement for delete_after
+    Queues messages per channel and removes expired ones with bulk deletes
+    """
+
+    def __init__(self, interval: float = 2.0):
+        self.interval = interval
+        self._pending = defaultdict(list)  # channel_id -> [(due, message)]
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background deletion worker"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._worker())
+
+    async def close(self):
+        """Stop the worker and delete everything still queued"""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        await self.flush(force=True)
+
+    def schedule(self, message: discord.Message, delay: float = 10):
+        """Queue a message for deletion after delay seconds"""
+        self._pending[message.channel.id].append((time.monotonic() + delay, message))
+
+    async def send(self, ctx, delay: float = 10, **kwargs) -> discord.Message:
+        """Send a message and queue it for deletion"""
+        message = await ctx.send(**kwargs)
+        self.schedule(message, delay)
+        return message
+
+    async def flush(self, force: bool = False):
+        """Delete every queued message that is due (or all of them when forced)"""
+        now = time.monotonic()
+
+        for channel_id in list(self._pending):
+            entries = self._pending[channel_id]
+            due = [message for when, message in entries if force or when <= now]
+            if not due:
+                continue
+
+            remaining = [(when, message) for when, message in entries if not (force or when <= now)]
+            if remaining:
+                self._pending[channel_id] = remaining
+            else:
+                del self._pending[channel_id]
+
+            await self._delete(due[0].channel, due)
+
+    async def _delete(self, channel, messages: List[discord.Message]):
+        """Bulk delete when permitted, otherwise fall back to single deletes"""
+        guild = getattr(channel, "guild", None)
+        can_bulk = (
+            guild is not None
+            and hasattr(channel, "delete_messages")
+            and channel.permissions_for(guild.me).manage_messages
+        )
+
+        if can_bulk:
+            # Bulk delete accepts at most 100 messages per call
+            for i in range(0, len(messages), 100):
+                try:
+                    await channel.delete_messages(messages[i:i + 100])
+                except discord.HTTPException:
+                    pass
+            return
+
+        for message in messages:
+            try:
+                await message.delete()
+            except discord.HTTPException:
+                pass
+
+    async def _worker(self):
+        """Flush due deletions every interval"""
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
@@ -5,10 +5,22 @@ Real-time control and statistics with gaming design
 
 from aiohttp import web
 import aiohttp_cors
-import json
-from datetime import datetime
+from datetime import timedelta
+import functools
 import os
 
+# Fast JSON encoding for API responses, stdlib fallback
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    from json import dumps as _dumps
+
+# JSON responses encoded with the fast encoder above
+json_response = functools.partial(web.json_response, dumps=_dumps)
+
 
 def create_app(bot):
     """Create web application with routes"""
@@ -554,11 +566,11 @@ def create_app(bot):
             'servers': len(bot.guilds),
             'users': len(bot.users),
             'commands': bot.commands_executed,
-            'uptime': str(datetime.utcnow() - bot.start_time),
+            'uptime': str(timedelta(seconds=int(bot.uptime))),
             'now_playing': now_playing
         }
 
-        return web.json_response(stats)
+        return json_response(stats)
 
     @routes.get('/api/servers')
     async def servers(request):
@@ -574,7 +586,7 @@ def create_app(bot):
                 'playing': bool(guild.voice_client and guild.voice_client.playing)
             })
 
-        return web.json_response(servers_list)
+        return json_response(servers_list)
 
     @routes.get('/api/queue/{guild_id}')
     async def queue(request):
@@ -584,20 +596,21 @@ def create_app(bot):
 
         guild = bot.get_guild(guild_id)
         if not guild or not guild.voice_client:
-            return web.json_response({'error': 'Guild not found or not playing'}, status=404)
+            return json_response({'error': 'Guild not found or not playing'}, status=404)
 
         player = guild.voice_client
         queue_list = []
 
         for track in player.queue:
+            requester = player.queue.requester_of(track)
             queue_list.append({
                 'title': track.title,
                 'author': track.author,
                 'duration': track.length // 1000,
-                'requester': str(track.requester) if hasattr(track, 'requester') else 'Unknown'
+                'requester': str(requester) if requester is not None else 'Unknown'
             })
 
-        return web.json_response({
+        return json_response({
             'guild': guild.name,
             'queue': queue_list,
             'loop_mode': player.loop_mode
@@ -609,12 +622,12 @@ def create_app(bot):
         bot = request.app['bot']
         bot.cache.clear()
 
-        return web.json_response({'status': 'success', 'message': 'Cache cleared'})
+        return json_response({'status': 'success', 'message': 'Cache cleared'})
 
     @routes.get('/health')
     async def health(request):
         """Health check endpoint"""
-        return web.json_response({'status': 'healthy'})
+        return json_response({'status': 'healthy'})
 
     # Add routes to app
     app.add_routes(routes)
@@ -0,0 +1,9 @@
+"""
+Shared test setup
+"""
+
+import sys
+from pathlib import Path
+
+# Modules import each other as top-level packages (bot, core, utils, ...)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,111 @@
+"""
+Tests for buffered guild settings writes
+"""
+
+import asyncio
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from database.manager import DatabaseManager
+
+
+class FailingConnection:
+    """Wraps a real connection, failing settings writes for one guild"""
+
+    def __init__(self, conn, failing_guild: int):
+        self._conn = conn
+        self.failing_guild = failing_guild
+
+    def execute(self, sql, params=()):
+        if params and params[0] == self.failing_guild and "guild_settings" in sql:
+            raise aiosqlite.OperationalError("database is locked")
+        return self._conn.execute(sql, params)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "kazebeats.db"))
+    await manager.setup()
+    yield manager
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_coalesced_settings(db):
+    await db.set_guild_prefix(1, "!")
+    await db.set_guild_dj_role(1, 123)
+    await db.set_guild_prefix(1, "?")  # Later writes win
+
+    assert await db.get_guild_prefix(1) == "?"
+    assert (await db.get_guild_settings(1))['dj_role_id'] == 123
+    assert not db._pending_settings
+
+
+@pytest.mark.asyncio
+async def test_flush_failure_keeps_other_writes(db):
+    real_conn = db.conn
+    db.conn = FailingConnection(real_conn, failing_guild=2)
+    await db.set_guild_prefix(1, "!")
+    await db.set_guild_prefix(2, "?")
+
+    await db.flush_settings()
+
+    # The healthy guild is committed, the failing one waits for the next flush
+    assert db._pending_settings == {2: {"prefix": "?"}}
+
+    # A newer write made before the retry wins over the restored value
+    await db.set_guild_dj_role(2, 456)
+    await db.set_guild_prefix(2, "$")
+    db.conn = real_conn
+    assert await db.get_guild_prefixes() == {1: "!", 2: "$"}
+    assert (await db.get_guild_settings(2))['dj_role_id'] == 456
+    assert not db._pending_settings
+
+
+@pytest.mark.asyncio
+async def test_unknown_setting_is_rejected_up_front(db):
+    with pytest.raises(ValueError):
+        await db.set_guild_feature(1, "autodj", True)
+
+    assert not db._pending_settings
+    assert db._flush_task is None
+
+
+class SlowConnection:
+    """Wraps a real connection, yielding to the loop before every statement"""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    async def execute(self, sql, params=()):
+        await asyncio.sleep(0.01)
+        return await self._conn.execute(sql, params)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_in_flight_flush(tmp_path):
+    path = str(tmp_path / "kazebeats.db")
+    db = DatabaseManager(path)
+    await db.setup()
+    db.conn = SlowConnection(db.conn)
+
+    for guild_id in range(1, 4):
+        await db.set_guild_prefix(guild_id, "!")
+    flush = asyncio.create_task(db.flush_settings())
+    await asyncio.sleep(0)  # Let the flush start its first statement
+    await db.set_guild_prefix(4, "?")  # Queued behind the running flush
+
+    await db.close()
+    await flush
+
+    async with aiosqlite.connect(path) as conn:
+        async with conn.execute("SELECT guild_id, prefix FROM guild_settings") as cursor:
+            assert dict(await cursor.fetchall()) == {1: "!", 2: "!", 3: "!", 4: "?"}
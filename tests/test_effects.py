@@ -0,0 +1,76 @@
+"""
+Tests for the effects cog's prebuilt filter data
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from cogs import effects
+from cogs.effects import Effects
+
+
+@pytest.mark.parametrize("name", ["gaming", "movie", "cinema", "party"])
+def test_preset_bands_build_equalizer_filters(name):
+    bands = effects._PRESET_MAP[name][0]
+    filters = Effects._equalizer_filters(bands)
+
+    payload = {band["band"]: band["gain"] for band in filters.equalizer.payload.values()}
+    assert len(payload) == 15
+    for band in bands:
+        assert payload[band["band"]] == band["gain"]
+
+
+def make_cog(max_bass: int = 20) -> Effects:
+    bot = SimpleNamespace(config=SimpleNamespace(MAX_BASS_BOOST=max_bass))
+    return Effects(bot)
+
+
+def test_cog_builds_bass_bands_for_every_level():
+    cog = make_cog()
+
+    assert len(cog._bass_bands) == 21
+    filters = Effects._equalizer_filters(cog._bass_bands[10])
+    assert filters.equalizer.payload[0]["gain"] == pytest.approx(0.5)
+
+
+def test_bass_bands_follow_the_weight_curve():
+    cog = make_cog()
+
+    for level, bands in enumerate(cog._bass_bands):
+        assert [band["band"] for band in bands] == list(range(15))
+        assert [band["gain"] for band in bands] == pytest.approx(
+            [level * (1 - band * 0.1) / 20 if band < 6 else 0.0 for band in range(15)]
+        )
+
+
+@pytest.mark.asyncio
+async def test_feature_toggle_event_drops_cached_flag():
+    cog = make_cog()
+    cog._feature_cache.update({1: (True, float("inf")), 2: (True, float("inf"))})
+
+    await cog.on_guild_feature_toggle(1, "lyrics", False)
+    assert 1 in cog._feature_cache
+
+    await cog.on_guild_feature_toggle(1, "effects", False)
+    assert 1 not in cog._feature_cache
+    assert 2 in cog._feature_cache
+
+
+@pytest.mark.asyncio
+async def test_effects_menu_follows_bot_avatar_changes():
+    cog = make_cog()
+    cog.bot.user = SimpleNamespace(id=1, display_avatar=SimpleNamespace(key="a", url="https://cdn/a.png"))
+    ctx = SimpleNamespace(send=AsyncMock())
+
+    await cog.show_effects_menu(ctx)
+    await cog.show_effects_menu(ctx)
+    first = cog._menu_embed
+    assert ctx.send.await_args.kwargs["embed"] is first
+    assert first.footer.icon_url == "https://cdn/a.png"
+
+    cog.bot.user.display_avatar = SimpleNamespace(key="b", url="https://cdn/b.png")
+    await cog.show_effects_menu(ctx)
+    assert cog._menu_embed is not first
+    assert cog._menu_embed.footer.icon_url == "https://cdn/b.png"
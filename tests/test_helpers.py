@@ -0,0 +1,73 @@
+"""
+Tests for the batched DeleteScheduler
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from utils.helpers import DeleteScheduler
+
+
+def make_channel(manage_messages: bool, channel_id: int = 1):
+    """Text channel stand-in with a configurable manage_messages permission"""
+    guild = SimpleNamespace(me=object())
+    return SimpleNamespace(
+        id=channel_id,
+        guild=guild,
+        delete_messages=AsyncMock(),
+        permissions_for=lambda member: SimpleNamespace(manage_messages=manage_messages)
+    )
+
+
+def make_message(channel):
+    return SimpleNamespace(channel=channel, delete=AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_due_messages_are_bulk_deleted_when_permitted():
+    scheduler = DeleteScheduler()
+    channel = make_channel(manage_messages=True)
+    due = [make_message(channel) for _ in range(3)]
+    later = make_message(channel)
+
+    for message in due:
+        scheduler.schedule(message, delay=0)
+    scheduler.schedule(later, delay=60)
+    await scheduler.flush()
+
+    channel.delete_messages.assert_awaited_once_with(due)
+    later.delete.assert_not_awaited()
+    assert [message for _, message in scheduler._pending[channel.id]] == [later]
+
+
+@pytest.mark.asyncio
+async def test_messages_are_deleted_one_by_one_without_permission():
+    scheduler = DeleteScheduler()
+    channel = make_channel(manage_messages=False)
+    messages = [make_message(channel) for _ in range(2)]
+
+    for message in messages:
+        scheduler.schedule(message, delay=0)
+    await scheduler.flush()
+
+    channel.delete_messages.assert_not_awaited()
+    for message in messages:
+        message.delete.assert_awaited_once()
+    assert not scheduler._pending
+
+
+@pytest.mark.asyncio
+async def test_close_forces_pending_deletes():
+    scheduler = DeleteScheduler()
+    channels = [make_channel(manage_messages=True, channel_id=n) for n in range(2)]
+    messages = [make_message(channel) for channel in channels]
+
+    for message in messages:
+        scheduler.schedule(message, delay=60)
+    await scheduler.close()
+
+    for channel, message in zip(channels, messages):
+        channel.delete_messages.assert_awaited_once_with([message])
+    assert not scheduler._pending
@@ -0,0 +1,120 @@
+"""
+Tests for the list-backed QueueManager
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from core.queue_manager import QueueManager
+
+
+def make_track(n: int, length: int = 1000):
+    """Minimal stand-in for a wavelink.Playable"""
+    return SimpleNamespace(
+        title=f"Track {n}",
+        author="Artist",
+        length=length,
+        uri=f"https://www.youtube.com/watch?v={n}"
+    )
+
+
+async def filled_queue(count: int, **kwargs) -> tuple[QueueManager, list]:
+    queue = QueueManager(**kwargs)
+    tracks = [make_track(n) for n in range(count)]
+    for track in tracks:
+        await queue.put(track)
+    return queue, tracks
+
+
+# Head pointer and compaction
+@pytest.mark.asyncio
+async def test_get_advances_head_then_compacts():
+    queue, tracks = await filled_queue(4)
+
+    assert await queue.get() is tracks[0]
+    assert queue._head == 1
+    assert list(queue) == tracks[1:]
+
+    # Half the list is consumed: the dead slots are dropped
+    assert await queue.get() is tracks[1]
+    assert queue._head == 0
+    assert queue._queue == tracks[2:]
+    assert len(queue) == 2
+
+
+@pytest.mark.asyncio
+async def test_put_front_reuses_vacated_slot():
+    queue, tracks = await filled_queue(4)
+    await queue.get()
+
+    front = make_track(99)
+    assert await queue.put_front(front)
+    assert queue._head == 0
+    assert list(queue) == [front, *tracks[1:]]
+
+
+@pytest.mark.asyncio
+async def test_draining_queue_leaves_it_empty():
+    queue, tracks = await filled_queue(3)
+
+    assert [await queue.get() for _ in tracks] == tracks
+    assert queue.is_empty
+    assert await queue.get() is None
+    assert queue.total_duration_ms == 0
+
+
+# Indexing
+@pytest.mark.asyncio
+async def test_negative_indices_count_from_the_end():
+    queue, tracks = await filled_queue(5)
+    await queue.get()  # Leave a consumed slot in front of the head
+    upcoming = tracks[1:]
+
+    assert await queue.peek(-1) is upcoming[-1]
+    assert await queue.remove(-1) is upcoming.pop()
+    assert await queue.move(-1, 0)
+    upcoming.insert(0, upcoming.pop())
+    assert await queue.swap(0, -1)
+    upcoming[0], upcoming[-1] = upcoming[-1], upcoming[0]
+
+    assert list(queue) == upcoming
+    assert queue.total_duration_ms == sum(track.length for track in upcoming)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("index", [3, 10, -4, -10])
+async def test_out_of_range_indices_are_rejected(index):
+    queue, tracks = await filled_queue(4)
+    await queue.get()
+
+    assert await queue.peek(index) is None
+    assert await queue.remove(index) is None
+    assert not await queue.move(index, 0)
+    assert not await queue.swap(0, index)
+    assert list(queue) == tracks[1:]
+
+
+# Bulk enqueue
+@pytest.mark.asyncio
+async def test_extend_propagates_requester_on_get():
+    queue = QueueManager()
+    requester = SimpleNamespace(id=42)
+    tracks = [make_track(n) for n in range(3)]
+
+    assert await queue.extend(tracks, requester=requester) == 3
+    assert all(queue.requester_of(track) is requester for track in queue)
+    assert queue.get_stats()['unique_requesters'] == 1
+
+    track = await queue.get()
+    assert track.requester is requester
+    assert id(track) not in queue._requesters
+
+
+@pytest.mark.asyncio
+async def test_extend_stops_at_max_size():
+    queue, _ = await filled_queue(2, max_size=4)
+
+    assert await queue.extend([make_track(n) for n in range(10, 15)]) == 2
+    assert len(queue) == 4
+    assert await queue.extend([make_track(20)]) == 0